@@ -1,35 +1,65 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
-from fastapi.responses import StreamingResponse
-import httpx
-import json
+from fastapi.responses import ORJSONResponse, Response
+import aiohttp
+import re
+import orjson
 import uvicorn
 from typing import Optional, Dict, Any
 import os
+import sys
 import asyncio
+import logging
+import multiprocessing
+import time
 from balldontlie import BalldontlieAPI
 from pathlib import Path
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open one pooled aiohttp session for the lifetime of the server"""
+    app.state.http = aiohttp.ClientSession(
+        # Ollama (Go net/http) keeps idle HTTP/1.1 connections open, so hold them well past
+        # aiohttp's 15s default and never re-resolve the fixed Ollama host
+        connector=aiohttp.TCPConnector(
+            limit=1000, keepalive_timeout=300, ttl_dns_cache=None,
+        ),
+        # No overall deadline since generations can stream for minutes, but fail fast if Ollama is down;
+        # sock_connect leaves out the wait for a free pool slot, so a busy pool queues instead of failing
+        timeout=aiohttp.ClientTimeout(total=None, sock_connect=5.0),
+    )
+    yield
+    await app.state.http.close()
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+log = logging.getLogger(__name__)
+
+# Configured before the startup messages below; per-request tracing is logged at DEBUG,
+# so it is skipped entirely at the default INFO level
+GLOBAL_LOG_LEVEL = os.environ.get("GLOBAL_LOG_LEVEL", "INFO").upper()
+logging.basicConfig(stream=sys.stdout, level=GLOBAL_LOG_LEVEL)
 
 ####################################
 # Load .env file
 ####################################
 
 OPEN_WEBUI_DIR = Path(__file__).parent  # the path containing this file
-print(OPEN_WEBUI_DIR)
+log.debug("OPEN_WEBUI_DIR: %s", OPEN_WEBUI_DIR)
 
 BACKEND_DIR = OPEN_WEBUI_DIR.parent  # the path containing this file
 BASE_DIR = BACKEND_DIR.parent  # the path containing the backend/
 
-print(BACKEND_DIR)
-print(BASE_DIR)
+log.debug("BACKEND_DIR: %s", BACKEND_DIR)
+log.debug("BASE_DIR: %s", BASE_DIR)
 
 try:
     from dotenv import find_dotenv, load_dotenv
 
     load_dotenv(find_dotenv(str(BASE_DIR / ".env")))
 except ImportError:
-    print("dotenv not installed, skipping...")
+    log.warning("dotenv not installed, skipping...")
 
 # Initialize the balldontlie API
 balldontlie_api = BalldontlieAPI(api_key=os.environ.get("BALLDONTLIE_API_KEY", None))
@@ -37,8 +67,61 @@ balldontlie_api = BalldontlieAPI(api_key=os.environ.get("BALLDONTLIE_API_KEY", N
 # Configure the Ollama endpoint - you can change this to your Ollama instance
 OLLAMA_API_URL = "http://localhost:11434"
 
-# Create an async HTTP client
-async_client = httpx.AsyncClient(timeout=None)
+# Size of the chunks read from Ollama's response body when proxying
+PROXY_CHUNK_SIZE = 64 * 1024
+
+# Headers that describe the proxy's own connection to Ollama rather than the response itself;
+# uvicorn also writes its own Date and Server headers
+UPSTREAM_SKIP_HEADERS = frozenset((
+    b"connection", b"keep-alive", b"proxy-authenticate", b"proxy-authorization",
+    b"te", b"trailer", b"transfer-encoding", b"upgrade", b"date", b"server",
+))
+
+
+class UpstreamResponse(Response):
+    """
+    Relay an Ollama response with its own status and headers, writing each chunk
+    straight to the ASGI send callable
+    """
+
+    def __init__(self, upstream: aiohttp.ClientResponse):
+        self.upstream = upstream
+        self.status_code = upstream.status
+        self.background = None
+        # aiohttp hands back a decoded body, so a compressed length would no longer match
+        skip = UPSTREAM_SKIP_HEADERS
+        if "Content-Encoding" in upstream.headers:
+            skip = skip | {b"content-encoding", b"content-length"}
+        self.raw_headers = [
+            (name.lower(), value)
+            for name, value in upstream.raw_headers
+            if name.lower() not in skip
+        ]
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await send({
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            })
+            async for chunk in self.upstream.content.iter_chunked(PROXY_CHUNK_SIZE):
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            self.upstream.release()
+        if self.background is not None:
+            await self.background()
+
+# OpenWebUI polls /api/tags on every page navigation while the model list rarely changes,
+# so Ollama's answer is reused for a few seconds
+MODELS_CACHE_TTL = 10.0
+models_cache = {"result": None, "expiry": 0.0}
+models_cache_lock = asyncio.Lock()
+
+# Byte patterns used to inspect a chat body without decoding the whole JSON document
+SYSTEM_ROLE_PATTERN = re.compile(rb'"role"\s*:\s*"system"')
+TASK_PATTERN = re.compile(rb'"task"\s*:\s*"([^"]*)"')
 
 @app.get("/api/version")
 async def get_version():
@@ -46,22 +129,31 @@ async def get_version():
     return {"version": "0.1.0", "custom_server": True}
 
 @app.get("/api/tags")
-async def get_models():
+async def get_models(request: Request):
     """
     List available models from Ollama
     """
-    print("get_models")
+    log.debug("get_models")
+    if time.monotonic() < models_cache["expiry"]:
+        return Response(content=models_cache["result"], media_type="application/json")
+    session = request.app.state.http
     try:
-        print(f"{OLLAMA_API_URL}/api/tags")
-        # Properly await the async request
-        response = await async_client.get(f"{OLLAMA_API_URL}/api/tags")
-        response.raise_for_status()
-        models = response.json()
-        print(models)
-        # You can modify the model list here if you want to filter or transform it
-        return models
+        async with models_cache_lock:
+            # Another request may have refreshed the cache while this one waited for the lock
+            if time.monotonic() >= models_cache["expiry"]:
+                log.debug("%s/api/tags", OLLAMA_API_URL)
+                # Properly await the async request
+                async with session.get(f"{OLLAMA_API_URL}/api/tags") as response:
+                    response.raise_for_status()
+                    models_cache["result"] = await response.read()
+                models_cache["expiry"] = time.monotonic() + MODELS_CACHE_TTL
+            models = models_cache["result"]
+        log.debug("models: %s", models)
+        # You can modify the model list here if you want to filter or transform it;
+        # until then Ollama's bytes are returned as-is instead of being decoded and re-encoded
+        return Response(content=models, media_type="application/json")
     except Exception as e:
-        print(e)
+        log.error("Error listing models: %s", e)
         return {"error": str(e)}
 
 @app.post("/api/chat")
@@ -69,110 +161,100 @@ async def chat(request: Request):
     """
     Main chat endpoint that processes requests from OpenWebUI
     """
-    print("chat")
+    log.debug("chat")
+    session = request.app.state.http
     body = await request.body()
-    data = json.loads(body)
-    print("data", data)
-    
-    # Check if this is a streaming request
-    is_streaming = data.get("stream", True)  # Default to True for backward compatibility
+    log.debug("data %s", body)
     
-    async def generate_response():
-        try:
+    try:
+        # Bodies that already carry a system prompt are forwarded untouched;
+        # only decode and re-encode when one has to be inserted
+        payload = body
+        if not SYSTEM_ROLE_PATTERN.search(body):
+            data = orjson.loads(body)
             if "messages" in data:
-                if not any(msg["role"] == "system" for msg in data["messages"]):
-                    data["messages"].insert(0, {
-                        "role": "system",
-                        "content": "You are a helpful AI assistant."
-                    })
-                    
-            if "metadata" in data:
-                # TODO: Handle different tasks 
-                if "task" in data["metadata"]:
-                    task = data["metadata"]["task"]
-                    if task == "tags_generation":
-                        print("tags_generation")
-                    elif task == "title_generation":
-                        print("title_generation")
-                     
-                else:
-                    print("chat task")
-            
-            print("data", data)
-            
-            # Forward the modified request to Ollama
-            async with async_client.stream(
-                "POST",
-                f"{OLLAMA_API_URL}/api/chat",
-                json=data,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if is_streaming:
-                    # For streaming responses, yield chunks as they come
-                    async for chunk in response.aiter_bytes():
-                        yield chunk
-                else:
-                    # For non-streaming responses, accumulate the full response
-                    full_response = b""
-                    async for chunk in response.aiter_bytes():
-                        full_response += chunk
-                    yield full_response
-                    
-        except Exception as e:
-            print(f"Error in chat: {str(e)}")
-            yield json.dumps({"error": str(e)}).encode()
+                data["messages"].insert(0, {
+                    "role": "system",
+                    "content": "You are a helpful AI assistant."
+                })
+                payload = orjson.dumps(data)
+                
+        # TODO: Handle different tasks 
+        task_match = TASK_PATTERN.search(body)
+        if task_match:
+            task = task_match.group(1)
+            if task == b"tags_generation":
+                log.debug("tags_generation")
+            elif task == b"title_generation":
+                log.debug("title_generation")
+        elif b'"metadata"' in body:
+            log.debug("chat task")
+        
+        log.debug("data %s", payload)
+        
+        # Forward the modified request to Ollama
+        response = await session.post(
+            f"{OLLAMA_API_URL}/api/chat",
+            data=payload,
+            headers={"Content-Type": "application/json"}
+        )
+    except Exception as e:
+        log.error("Error in chat: %s", e)
+        return ORJSONResponse({"error": str(e)})
     
-    # Set the appropriate content type based on streaming vs non-streaming
-    return StreamingResponse(
-        generate_response(),
-        media_type="application/x-ndjson" if is_streaming else "application/json"
-    )
+    # Hand Ollama's body and headers straight to the client, streamed or not; the
+    # bytes are the same either way, so there is no per-chunk Python generator in between
+    return UpstreamResponse(response)
 
 @app.post("/api/generate")
 async def generate(request: Request):
     """
     Handle direct text generation requests
     """
-    print("generate")
+    log.debug("generate")
+    session = request.app.state.http
     body = await request.body()
-    data = json.loads(body)
+    data = orjson.loads(body)
     
-    async def generate_response():
-        try:
-            # Add your custom processing here
-            # Example: Add custom prompt processing
-            if "prompt" in data:
-                data["prompt"] = f"Process this request: {data['prompt']}"
-                
-            if "metadata" in data:
-                # TODO: Handle different tasks 
-                if "task" in data["metadata"]:
-                    task = data["metadata"]["task"]
-                    if task == "tags_generation":
-                        print("tags_generation")
-                    elif task == "title_generation":
-                        print("title_generation")
-                     
-                else:
-                    print("chat task")
-                        
-            # Forward to Ollama
-            async with async_client.stream(
-                "POST",
-                f"{OLLAMA_API_URL}/api/generate",
-                json=data,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                async for chunk in response.aiter_bytes():
-                    yield chunk
-        except Exception as e:
-            yield json.dumps({"error": str(e)}).encode()
+    try:
+        # Add your custom processing here
+        # Example: Add custom prompt processing
+        if "prompt" in data:
+            data["prompt"] = f"Process this request: {data['prompt']}"
+            
+        if "metadata" in data:
+            # TODO: Handle different tasks 
+            if "task" in data["metadata"]:
+                task = data["metadata"]["task"]
+                if task == "tags_generation":
+                    log.debug("tags_generation")
+                elif task == "title_generation":
+                    log.debug("title_generation")
+                 
+            else:
+                log.debug("chat task")
+                    
+        # Forward to Ollama
+        response = await session.post(
+            f"{OLLAMA_API_URL}/api/generate",
+            data=orjson.dumps(data),
+            headers={"Content-Type": "application/json"}
+        )
+    except Exception as e:
+        return ORJSONResponse({"error": str(e)})
     
-    return StreamingResponse(
-        generate_response(),
-        media_type="application/json"
-    )
+    return UpstreamResponse(response)
 
 if __name__ == "__main__":
     # Run the server on port 11434 to match Ollama's default
-    uvicorn.run(app, host="0.0.0.0", port=11435) 
\ No newline at end of file
+    # Each worker is its own process with its own event loop and Ollama connection pool.
+    # "auto" picks uvloop and httptools whenever they are installed (uvicorn[standard]).
+    uvicorn.run(
+        "custom_llm_server:app",
+        host="0.0.0.0",
+        port=11435,
+        workers=2 * multiprocessing.cpu_count() + 1,
+        loop="auto",
+        http="auto",
+        limit_concurrency=1000,
+    ) 
\ No newline at end of file
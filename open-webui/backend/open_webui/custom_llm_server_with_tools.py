@@ -1,16 +1,21 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
-from fastapi.responses import StreamingResponse
-import httpx
-import json
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+import aiohttp
+import msgspec
+import orjson
 import uvicorn
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import os
+import sys
 import asyncio
+import logging
+import multiprocessing
+import time
 from balldontlie import BalldontlieAPI
 from pathlib import Path
 import ollama
-from ollama_tools import  generate_function_description, use_tools
-import traceback
+from ollama_tools import  generate_function_description, ause_tools
 from nba_tools import (
     # get_player_injuries, 
     # get_game_odds, 
@@ -20,29 +25,59 @@ from nba_tools import (
     get_game_info, 
     get_team_info, 
     # get_team_standings
+    warm_up,
+    close_http_client,
     )
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open one pooled aiohttp session for the lifetime of the server"""
+    app.state.http = aiohttp.ClientSession(
+        # Ollama (Go net/http) keeps idle HTTP/1.1 connections open, so hold them well past
+        # aiohttp's 15s default and never re-resolve the fixed Ollama host
+        connector=aiohttp.TCPConnector(
+            limit=1000, keepalive_timeout=300, ttl_dns_cache=None,
+        ),
+        # No overall deadline since generations can stream for minutes, but fail fast if Ollama is down;
+        # sock_connect leaves out the wait for a free pool slot, so a busy pool queues instead of failing
+        timeout=aiohttp.ClientTimeout(total=None, sock_connect=5.0),
+    )
+    # Fill the NBA tool caches in the background so the first tool call finds them warm
+    warm_up_task = asyncio.create_task(warm_up())
+    yield
+    warm_up_task.cancel()
+    await close_http_client()
+    await app.state.http.close()
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+log = logging.getLogger(__name__)
+
+# Configured before the startup messages below; per-request tracing is logged at DEBUG,
+# so it is skipped entirely at the default INFO level
+GLOBAL_LOG_LEVEL = os.environ.get("GLOBAL_LOG_LEVEL", "INFO").upper()
+logging.basicConfig(stream=sys.stdout, level=GLOBAL_LOG_LEVEL)
 
 ####################################
 # Load .env file
 ####################################
 
 OPEN_WEBUI_DIR = Path(__file__).parent  # the path containing this file
-print(OPEN_WEBUI_DIR)
+log.debug("OPEN_WEBUI_DIR: %s", OPEN_WEBUI_DIR)
 
 BACKEND_DIR = OPEN_WEBUI_DIR.parent  # the path containing this file
 BASE_DIR = BACKEND_DIR.parent  # the path containing the backend/
 
-print(BACKEND_DIR)
-print(BASE_DIR)
+log.debug("BACKEND_DIR: %s", BACKEND_DIR)
+log.debug("BASE_DIR: %s", BASE_DIR)
 
 try:
     from dotenv import find_dotenv, load_dotenv
 
     load_dotenv(find_dotenv(str(BASE_DIR / ".env")))
 except ImportError:
-    print("dotenv not installed, skipping...")
+    log.warning("dotenv not installed, skipping...")
 
 # Initialize the balldontlie API
 balldontlie_api = BalldontlieAPI(api_key=os.environ.get("BALLDONTLIE_API_KEY", None))
@@ -50,12 +85,61 @@ balldontlie_api = BalldontlieAPI(api_key=os.environ.get("BALLDONTLIE_API_KEY", N
 # Configure the Ollama endpoint - you can change this to your Ollama instance
 OLLAMA_API_URL = "http://localhost:11434"
 
-# Create an async HTTP client
-async_client = httpx.AsyncClient(timeout=None)
+# Size of the chunks read from Ollama's response body when proxying
+PROXY_CHUNK_SIZE = 64 * 1024
+
+# Headers that describe the proxy's own connection to Ollama rather than the response itself;
+# uvicorn also writes its own Date and Server headers
+UPSTREAM_SKIP_HEADERS = frozenset((
+    b"connection", b"keep-alive", b"proxy-authenticate", b"proxy-authorization",
+    b"te", b"trailer", b"transfer-encoding", b"upgrade", b"date", b"server",
+))
+
+
+class UpstreamResponse(Response):
+    """
+    Relay an Ollama response with its own status and headers, writing each chunk
+    straight to the ASGI send callable
+    """
+
+    def __init__(self, upstream: aiohttp.ClientResponse):
+        self.upstream = upstream
+        self.status_code = upstream.status
+        self.background = None
+        # aiohttp hands back a decoded body, so a compressed length would no longer match
+        skip = UPSTREAM_SKIP_HEADERS
+        if "Content-Encoding" in upstream.headers:
+            skip = skip | {b"content-encoding", b"content-length"}
+        self.raw_headers = [
+            (name.lower(), value)
+            for name, value in upstream.raw_headers
+            if name.lower() not in skip
+        ]
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await send({
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            })
+            async for chunk in self.upstream.content.iter_chunked(PROXY_CHUNK_SIZE):
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            self.upstream.release()
+        if self.background is not None:
+            await self.background()
+
+# OpenWebUI polls /api/tags on every page navigation while the model list rarely changes,
+# so Ollama's answer is reused for a few seconds
+MODELS_CACHE_TTL = 10.0
+models_cache = {"result": None, "expiry": 0.0}
+models_cache_lock = asyncio.Lock()
 
 def query_model(messages, tools, model='llama3.1:latest'):
-    print("query_model")
-    print(messages)
+    log.debug("query_model")
+    log.debug("messages: %s", messages)
     response = ollama.chat(
         model=model,
         messages=messages,
@@ -79,17 +163,55 @@ def query_model(messages, tools, model='llama3.1:latest'):
 #     # data = response.json()
 #     return f"""The statistics for {Name} are: {Name}"""
 
-tools = [
-    # generate_function_description(get_player_injuries),
-    # generate_function_description(get_game_odds),
-    # generate_function_description(get_head_to_head_stats),
-    # generate_function_description(get_league_leaders),
-    generate_function_description(get_player_info),
-    generate_function_description(get_game_info),
-    generate_function_description(get_team_info),
-    # generate_function_description(get_team_standings),
-]
-functions = {function["function"]["name"]: globals()[function["function"]["name"]] for function in tools }
+# Functions exposed to the model as tools
+TOOL_FUNCTIONS = (
+    # get_player_injuries,
+    # get_game_odds,
+    # get_head_to_head_stats,
+    # get_league_leaders,
+    get_player_info,
+    get_game_info,
+    get_team_info,
+    # get_team_standings,
+)
+tools = tuple(generate_function_description(function) for function in TOOL_FUNCTIONS)
+# The descriptors never change, so their JSON is spliced into request bodies as-is
+_TOOLS_JSON_FRAGMENT = orjson.dumps(tools)
+# Interned names so dispatch lookups in ause_tools can short-circuit on identity
+functions = {sys.intern(function.__name__): function for function in TOOL_FUNCTIONS}
+
+
+class Message(msgspec.Struct, omit_defaults=True):
+    """A single chat message as Ollama expects it"""
+    role: str
+    content: str = ""
+    images: Optional[List[str]] = None
+    tool_calls: Optional[List[Dict[str, Any]]] = None
+
+
+class MessageRole(msgspec.Struct):
+    """The only field of an incoming message this server reads"""
+    role: str
+
+
+class ChatRequest(msgspec.Struct):
+    """The parts of an OpenWebUI chat request this server reads"""
+    # Incoming messages stay undecoded and are forwarded byte for byte, so fields this
+    # server does not know about (thinking, tool_name, a null content) reach Ollama intact
+    messages: List[msgspec.Raw] = []
+    stream: bool = True
+    model: str = "llama3.2:1b"
+    metadata: Optional[Dict[str, Any]] = None
+
+
+chat_request_decoder = msgspec.json.Decoder(ChatRequest)
+message_role_decoder = msgspec.json.Decoder(MessageRole)
+
+# Shared by every request; it is only ever read, never mutated
+_SYSTEM_PROMPT = Message(
+    role="system",
+    content="You are an assistant with access to tools, if you do not have a tool to deal with the user's request but you think you can answer do it so, if not explain your capabilities"
+)
 
 
 @app.get("/api/version")
@@ -98,22 +220,31 @@ async def get_version():
     return {"version": "0.1.0", "custom_server": True}
 
 @app.get("/api/tags")
-async def get_models():
+async def get_models(request: Request):
     """
     List available models from Ollama
     """
-    print("get_models")
+    log.debug("get_models")
+    if time.monotonic() < models_cache["expiry"]:
+        return Response(content=models_cache["result"], media_type="application/json")
+    session = request.app.state.http
     try:
-        print(f"{OLLAMA_API_URL}/api/tags")
-        # Properly await the async request
-        response = await async_client.get(f"{OLLAMA_API_URL}/api/tags")
-        response.raise_for_status()
-        models = response.json()
-        print(models)
-        # You can modify the model list here if you want to filter or transform it
-        return models
+        async with models_cache_lock:
+            # Another request may have refreshed the cache while this one waited for the lock
+            if time.monotonic() >= models_cache["expiry"]:
+                log.debug("%s/api/tags", OLLAMA_API_URL)
+                # Properly await the async request
+                async with session.get(f"{OLLAMA_API_URL}/api/tags") as response:
+                    response.raise_for_status()
+                    models_cache["result"] = await response.read()
+                models_cache["expiry"] = time.monotonic() + MODELS_CACHE_TTL
+            models = models_cache["result"]
+        log.debug("models: %s", models)
+        # You can modify the model list here if you want to filter or transform it;
+        # until then Ollama's bytes are returned as-is instead of being decoded and re-encoded
+        return Response(content=models, media_type="application/json")
     except Exception as e:
-        print(e)
+        log.error("Error listing models: %s", e)
         return {"error": str(e)}
 
 @app.post("/api/chat")
@@ -121,164 +252,166 @@ async def chat(request: Request):
     """
     Main chat endpoint that processes requests from OpenWebUI
     """
-    print("chat")
+    log.debug("chat")
+    session = request.app.state.http
     body = await request.body()
-    data = json.loads(body)
-    # print("data", data)
+    try:
+        req = chat_request_decoder.decode(body)
+        # A system prompt, when there is one, is the first message
+        messages = req.messages
+        if not messages or message_role_decoder.decode(messages[0]).role != "system":
+            messages.insert(0, _SYSTEM_PROMPT)
+    except msgspec.DecodeError as e:
+        log.error("Invalid chat request: %s", e)
+        return ORJSONResponse({"error": str(e)}, status_code=400)
+    # print("req", req)
     
-    is_streaming = data.get("stream", True)
+    is_streaming = req.stream
+    function_call = True
+    if req.metadata is not None:
+        # TODO: Handle different tasks 
+        if "task" in req.metadata:
+            task = req.metadata["task"]
+            if task == "tags_generation":
+                log.debug("tags_generation")
+                function_call = False
+            elif task == "title_generation":
+                log.debug("title_generation")
+                function_call = False
+            elif task == "autocomplete_generation":
+                log.debug("autocomplete_generation")
+                function_call = False
+        else:
+            log.debug("chat task")
+            log.debug("req %s", req)
     
+    if not function_call:
+        try:
+            response = await session.post(
+                f"{OLLAMA_API_URL}/api/chat",
+                data=msgspec.json.encode({
+                    'model': 'llama3.2:1b', 
+                    'messages': messages,
+                    'stream': is_streaming
+                }),
+                headers={"Content-Type": "application/json"}
+            )
+        except Exception as e:
+            log.error("Error in chat: %s", e)
+            return ORJSONResponse({"error": str(e)})
+        # Nothing to inspect on this path, so hand Ollama's response straight to the client
+        return UpstreamResponse(response)
+
     async def generate_response():
         try:
-            print("generate_response")
-            if "messages" in data:
-                if not any(msg["role"] == "system" for msg in data["messages"]):
-                    data["messages"].insert(0, {
-                        "role": "system",
-                        "content": "You are an assistant with access to tools, if you do not have a tool to deal with the user's request but you think you can answer do it so, if not explain your capabilities"
-                    })
-                
-            messages = data.get("messages", [{
-                        "role": "system",
-                        "content": "You are an assistant with access to tools, if you do not have a tool to deal with the user's request but you think you can answer do it so, if not explain your capabilities"
-                    }])
-            function_call = True
-            if "metadata" in data:
-                # TODO: Handle different tasks 
-                if "task" in data["metadata"]:
-                    task = data["metadata"]["task"]
-                    if task == "tags_generation":
-                        print("tags_generation")
-                        function_call = False
-                    elif task == "title_generation":
-                        print("title_generation")
-                        function_call = False
-                    elif task == "autocomplete_generation":
-                        print("autocomplete_generation")
-                        function_call = False
-                else:
-                    print("chat task")
-                    print("data", data)
-            
-            if not function_call:
-                async with async_client.stream(
-                    "POST",
-                    f"{OLLAMA_API_URL}/api/chat",
-                    json={
-                        'model': 'llama3.2:1b', 
-                        'messages': data['messages'],
-                        'stream': is_streaming
-                    },
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    async for chunk in response.aiter_bytes():
-                        yield chunk
-            else:    
-                # For function calling path
-                messages = data.get('messages', [])
-                
-                max_retries = 10
-                retry_count = 0
-                tool_call_success = False
-
-                while retry_count < max_retries and not tool_call_success:
-                    try:
-                        async with async_client.stream(
-                            "POST",
-                            f"{OLLAMA_API_URL}/api/chat",
-                            json={
-                                'model': data.get('model', 'llama3.2:1b'),
-                                'messages': messages,
-                                'tools': tools,
-                                'stream': is_streaming
-                            },
-                            headers={"Content-Type": "application/json"}
-                        ) as response:
-                            accumulated_response = b""
-                            tool_calls = None
-                            async for chunk in response.aiter_bytes():
-                                try:
-                                    # Decode and parse the JSON chunk
-                                    chunk_data = json.loads(chunk.decode('utf-8'))
-                                    print("Function call chunk:", chunk_data)  # Debug print
-                                    
-                                    if 'message' in chunk_data and 'tool_calls' in chunk_data['message']:
-                                        tool_calls = chunk_data['message']['tool_calls']
-                                        break
-                                    
-                                    if is_streaming:
-                                        yield chunk
-                                    else:
-                                        accumulated_response += chunk
-                                except json.JSONDecodeError:
-                                    # Handle incomplete JSON chunks
-                                    if is_streaming:
-                                        yield chunk
-                                    else:
-                                        accumulated_response += chunk
-                            
-                            if not is_streaming:
-                                print("Full response:", accumulated_response)  # Debug print
-                                yield accumulated_response
-
-                        if tool_calls:
-                            result = use_tools(tool_calls, functions)
-                            tool_call_success = True
-                        # else:
-                        #     # If no tool calls were found, add a message asking for proper tool usage
-                        #     messages.append({
-                        #         "role": "system",
-                        #         "content": "Please provide a properly formatted tool call. Your previous response did not include any tool calls."
-                        #     })
-                    except Exception as e:
-                        print(f"Tool call attempt {retry_count + 1} failed: {str(e)}")
-                        retry_count += 1
-                        if retry_count < max_retries:
-                            # Add a message to guide the model to provide better formatting
-                            # messages.append({
-                            #     "role": "system",
-                            #     "content": f"The previous tool call failed due to: {str(e)}. Please provide a properly formatted tool call."
-                            # })
-                            print()
-                        else:
-                            # If we've exhausted retries, yield an error message
-                            error_response = {"error": f"Failed to execute tool call after {max_retries} attempts: {str(e)}"}
-                            yield json.dumps(error_response).encode()
-                            return
-
-                if tool_call_success:
-                    messages.append({
-                        "role": "tool",
-                        "content": result
-                    })
-                    print("-"*64)
-                    print(f"\n\n\n toolcall made result is:\n{result}\n\n\n")
-                    print("-"*64)
-                    async with async_client.stream(
-                        "POST",
+            # For function calling path
+            max_retries = 10
+            retry_count = 0
+            tool_call_success = False
+
+            # The request is identical on every attempt, so serialize it once
+            req_body = b"".join((
+                b'{"model":', msgspec.json.encode(req.model),
+                b',"messages":', msgspec.json.encode(messages),
+                b',"tools":', _TOOLS_JSON_FRAGMENT,
+                b',"stream":', b'true' if is_streaming else b'false',
+                b'}',
+            ))
+
+            while retry_count < max_retries and not tool_call_success:
+                try:
+                    async with session.post(
                         f"{OLLAMA_API_URL}/api/chat",
-                        json={
-                            'model': data.get('model', 'llama3.2:1b'),
-                            'messages': messages,
-                            'stream': is_streaming
-                        },
+                        data=req_body,
                         headers={"Content-Type": "application/json"}
                     ) as response:
-                        accumulated_response = b""
-                        async for chunk in response.aiter_bytes():
+                        tool_calls = None
+                        if is_streaming:
+                            # Ollama emits a tool call as one complete NDJSON line ahead of any
+                            # content, so only the first line has to be inspected
+                            first_chunk = await response.content.readline()
+                        else:
+                            # A non-streaming reply is a single JSON line that can run past
+                            # readline's length limit, so it is read whole
+                            first_chunk = await response.read()
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug("Function call chunk: %s", first_chunk)
+
+                        if b'"tool_calls"' in first_chunk:
+                            try:
+                                chunk_data = orjson.loads(first_chunk)
+                            except orjson.JSONDecodeError:
+                                # Handle incomplete JSON chunks
+                                chunk_data = {}
+
+                            if 'message' in chunk_data and 'tool_calls' in chunk_data['message']:
+                                tool_calls = chunk_data['message']['tool_calls']
+
+                        if not tool_calls:
+                            # Plain answer: forward the rest of the body untouched
                             if is_streaming:
-                                yield chunk
+                                yield first_chunk
+                                async for chunk in response.content.iter_chunked(PROXY_CHUNK_SIZE):
+                                    yield chunk
                             else:
-                                accumulated_response += chunk
+                                log.debug("Full response: %s", first_chunk)
+                                yield first_chunk
+
+                    if not tool_calls:
+                        # The model answered without calling a tool and that answer has
+                        # already been passed on; asking again would only repeat it
+                        break
+                    result = await ause_tools(tool_calls, functions)
+                    tool_call_success = True
+                    # else:
+                    #     # If no tool calls were found, add a message asking for proper tool usage
+                    #     messages.append({
+                    #         "role": "system",
+                    #         "content": "Please provide a properly formatted tool call. Your previous response did not include any tool calls."
+                    #     })
+                except Exception as e:
+                    log.warning("Tool call attempt %d failed: %s", retry_count + 1, e)
+                    retry_count += 1
+                    if retry_count < max_retries:
+                        # Add a message to guide the model to provide better formatting
+                        # messages.append({
+                        #     "role": "system",
+                        #     "content": f"The previous tool call failed due to: {str(e)}. Please provide a properly formatted tool call."
+                        # })
+                        # Back off before asking Ollama again: 0.2s, 0.4s, 0.8s, ... capped at 2s
+                        await asyncio.sleep(min(2 ** retry_count * 0.1, 2.0))
+                    else:
+                        # If we've exhausted retries, yield an error message
+                        error_response = {"error": f"Failed to execute tool call after {max_retries} attempts: {str(e)}"}
+                        yield orjson.dumps(error_response)
+                        return
+
+            if tool_call_success:
+                messages.append(Message(role="tool", content=result))
+                log.debug("Tool call made, result is:\n%s", result)
+                async with session.post(
+                    f"{OLLAMA_API_URL}/api/chat",
+                    data=msgspec.json.encode({
+                        'model': req.model,
+                        'messages': messages,
+                        'stream': is_streaming
+                    }),
+                    headers={"Content-Type": "application/json"}
+                ) as response:
+                    accumulated_response = bytearray()
+                    async for chunk in response.content.iter_chunked(PROXY_CHUNK_SIZE):
+                        if is_streaming:
+                            yield chunk
+                        else:
+                            accumulated_response.extend(chunk)
 
-                        if not is_streaming:
-                            print("Full response:", accumulated_response)  # Debug print
-                            yield accumulated_response
+                    if not is_streaming:
+                        log.debug("Full response: %s", accumulated_response)
+                        yield bytes(accumulated_response)
 
         except Exception as e:
-            print(f"Error in chat: {str(e)}")
-            print(traceback.format_exc())
-            yield json.dumps({"error": str(e)}).encode()
+            log.exception("Error in chat: %s", e)
+            yield orjson.dumps({"error": str(e)})
     
     return StreamingResponse(
         generate_response(),
@@ -290,46 +423,50 @@ async def generate(request: Request):
     """
     Handle direct text generation requests
     """
-    print("generate")
+    log.debug("generate")
+    session = request.app.state.http
     body = await request.body()
-    data = json.loads(body)
+    data = orjson.loads(body)
     
-    async def generate_response():
-        try:
-            # Add your custom processing here
-            # Example: Add custom prompt processing
-            if "prompt" in data:
-                data["prompt"] = f"Process this request: {data['prompt']}"
-                
-            if "metadata" in data:
-                # TODO: Handle different tasks 
-                if "task" in data["metadata"]:
-                    task = data["metadata"]["task"]
-                    if task == "tags_generation":
-                        print("tags_generation")
-                    elif task == "title_generation":
-                        print("title_generation")
-                     
-                else:
-                    print("chat task")
-                        
-            # Forward to Ollama
-            async with async_client.stream(
-                "POST",
-                f"{OLLAMA_API_URL}/api/generate",
-                json=data,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                async for chunk in response.aiter_bytes():
-                    yield chunk
-        except Exception as e:
-            yield json.dumps({"error": str(e)}).encode()
+    try:
+        # Add your custom processing here
+        # Example: Add custom prompt processing
+        if "prompt" in data:
+            data["prompt"] = f"Process this request: {data['prompt']}"
+            
+        if "metadata" in data:
+            # TODO: Handle different tasks 
+            if "task" in data["metadata"]:
+                task = data["metadata"]["task"]
+                if task == "tags_generation":
+                    log.debug("tags_generation")
+                elif task == "title_generation":
+                    log.debug("title_generation")
+                 
+            else:
+                log.debug("chat task")
+                    
+        # Forward to Ollama
+        response = await session.post(
+            f"{OLLAMA_API_URL}/api/generate",
+            data=orjson.dumps(data),
+            headers={"Content-Type": "application/json"}
+        )
+    except Exception as e:
+        return ORJSONResponse({"error": str(e)})
     
-    return StreamingResponse(
-        generate_response(),
-        media_type="application/json"
-    )
+    return UpstreamResponse(response)
 
 if __name__ == "__main__":
     # Run the server on port 11434 to match Ollama's default
-    uvicorn.run(app, host="0.0.0.0", port=11435) 
\ No newline at end of file
+    # Each worker is its own process with its own event loop and Ollama connection pool.
+    # "auto" picks uvloop and httptools whenever they are installed (uvicorn[standard]).
+    uvicorn.run(
+        "custom_llm_server_with_tools:app",
+        host="0.0.0.0",
+        port=11435,
+        workers=2 * multiprocessing.cpu_count() + 1,
+        loop="auto",
+        http="auto",
+        limit_concurrency=1000,
+    ) 
\ No newline at end of file
@@ -1,10 +1,24 @@
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime, timedelta
-from balldontlie import BalldontlieAPI
 import os
 from pathlib import Path
-import traceback
+import logging
+import re
 from datetime import datetime
+import functools
+from operator import itemgetter
+from collections import Counter, defaultdict
+import asyncio
+import weakref
+import random
+import time
+import threading
+import sqlite3
+from urllib.parse import urlencode
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+import httpx
+import orjson
 
 
 # Mock data for testing
@@ -128,23 +142,31 @@ MOCK_INJURIES = [
     }
 ]
 
+# Exact-name lookups into the mock data; partial names still fall back to a scan
+_MOCK_PLAYER_INDEX = {
+    f"{player['first_name']} {player['last_name']}".casefold(): player for player in MOCK_PLAYERS
+}
+_MOCK_TEAM_INDEX = {
+    **{team["name"].casefold(): team for team in MOCK_TEAMS},
+    **{team["full_name"].casefold(): team for team in MOCK_TEAMS},
+}
+
+log = logging.getLogger(__name__)
+# Tool tracing is logged at DEBUG with lazy %s arguments, so nothing is formatted unless
+# NBA_TOOLS_LOG_LEVEL (or the root logger) lets it through
+NBA_TOOLS_LOG_LEVEL = os.environ.get("NBA_TOOLS_LOG_LEVEL", "NOTSET").upper()
+log.setLevel(NBA_TOOLS_LOG_LEVEL)
+
 # Global flags
 USE_MOCK_DATA = False
-DEBUG_MODE = False
 
 def set_debug_mode(debug: bool):
-    """Set whether to enable debug print statements.
+    """Set whether to emit this module's debug log messages.
     
     Args:
-        debug: Boolean indicating whether to enable debug prints
+        debug: Boolean indicating whether to enable debug logging
     """
-    global DEBUG_MODE
-    DEBUG_MODE = debug
-
-def debug_print(*args, **kwargs):
-    """Print debug messages only when DEBUG_MODE is True."""
-    if DEBUG_MODE:
-        print(*args, **kwargs)
+    log.setLevel(logging.DEBUG if debug else NBA_TOOLS_LOG_LEVEL)
 
 def set_use_mock_data(use_mock: bool):
     """Set whether to use mock data for testing.
@@ -160,25 +182,572 @@ def set_use_mock_data(use_mock: bool):
 ####################################
 
 OPEN_WEBUI_DIR = Path(__file__).parent  # the path containing this file
-print(OPEN_WEBUI_DIR)
+log.debug("OPEN_WEBUI_DIR: %s", OPEN_WEBUI_DIR)
 
 BACKEND_DIR = OPEN_WEBUI_DIR.parent  # the path containing this file
 BASE_DIR = BACKEND_DIR.parent  # the path containing the backend/
 
-print(BACKEND_DIR)
-print(BASE_DIR)
+log.debug("BACKEND_DIR: %s", BACKEND_DIR)
+log.debug("BASE_DIR: %s", BASE_DIR)
 
 try:
     from dotenv import find_dotenv, load_dotenv
 
     load_dotenv(find_dotenv(str(BASE_DIR / ".env")))
 except ImportError:
-    print("dotenv not installed, skipping...")
+    log.warning("dotenv not installed, skipping...")
+
+BALLDONTLIE_API_URL = "https://api.balldontlie.io"
+
+# Rate limits (429) and upstream hiccups are retried with jittered exponential
+# backoff (0.5s, 1s, 2s, ... plus up to 0.3s), honouring any Retry-After header
+# up to the same cap, so one tool call cannot hold a chat for the server's full wait
+API_MAX_RETRIES = 5
+API_MAX_RETRY_DELAY = 5.0
+API_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+# HTTP/2 lets a turn's concurrent tool calls share one multiplexed connection;
+# httpx needs the h2 package (httpx[http2]) for it
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    log.warning("h2 not installed, using HTTP/1.1 for the balldontlie API")
+    HTTP2_AVAILABLE = False
+
+def _create_http_client() -> httpx.AsyncClient:
+    """A pooled keep-alive client for the balldontlie API."""
+    return httpx.AsyncClient(
+        base_url=BALLDONTLIE_API_URL,
+        headers={
+            "Authorization": os.environ.get("BALLDONTLIE_API_KEY") or "",
+            "Accept": "application/json",
+        },
+        timeout=10.0,
+        # retries here only cover failed connection attempts
+        transport=httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            retries=3,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        ),
+    )
 
-# Initialize the API client
-api = BalldontlieAPI(api_key=os.environ.get("BALLDONTLIE_API_KEY"))
+# Every tool call on an event loop shares one client, created on first use; pooled
+# connections belong to the loop that opened them, so each loop gets its own
+_http_clients = weakref.WeakKeyDictionary()
+
+def _http_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None:
+        client = _http_clients[loop] = _create_http_client()
+    return client
+
+async def close_http_client():
+    """Close the running event loop's API client, e.g. when the server shuts down."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+# Outgoing requests are paced to stay under the API's per-minute quota (allowing a short
+# burst) and capped in number, so a burst of tool calls does not run into 429s. The quota
+# is per API key, so every uvicorn worker draws on the same pace through the disk cache file
+API_RATE_LIMIT = 55
+API_RATE_PERIOD = 60.0
+API_RATE_BURST = 5
+API_MAX_CONCURRENCY = 8
+# Theoretical arrival time of the next request under the rate limit (GCRA), as wall-clock
+# time since it is compared across processes. This copy only paces a worker that cannot
+# reach the shared one
+_rate_tat = 0.0
+# The limiter keeps its own connection to the cache file, so the cache's statements never
+# wait behind its transaction or run inside it; the lock guards both
+_rate_connection = None
+_rate_lock = threading.Lock()
+# Like the clients, semaphores belong to one event loop
+_api_semaphores = weakref.WeakKeyDictionary()
+
+def _advance_shared_rate_tat(connection, now: float, interval: float) -> float:
+    """Take the next slot from the TAT shared by all workers; returns the TAT before it."""
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        row = connection.execute("SELECT tat FROM rate_limit WHERE name = 'balldontlie'").fetchone()
+        tat = row[0] if row else 0.0
+        connection.execute(
+            "INSERT OR REPLACE INTO rate_limit (name, tat) VALUES ('balldontlie', ?)",
+            (max(tat, now) + interval,),
+        )
+        connection.execute("COMMIT")
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    return tat
+
+def _rate_limit_connection():
+    """The rate limiter's connection, opened on first use; None if it cannot be opened.
+
+    Call with _rate_lock held.
+    """
+    global _rate_connection
+    if _rate_connection is None:
+        try:
+            _rate_connection = _connect_api_cache()
+        except (OSError, sqlite3.Error) as e:
+            log.warning("Shared NBA API rate limit disabled, pacing this worker alone: %s", e)
+            _rate_connection = False
+    return _rate_connection or None
+
+def _reserve_rate_slot() -> float:
+    """Reserve the next request slot under the rate limit.
+
+    Returns:
+        Seconds to wait before sending the request
+    """
+    global _rate_tat
+    interval = API_RATE_PERIOD / API_RATE_LIMIT
+    with _rate_lock:
+        connection = _rate_limit_connection()
+        now = time.time()
+        tat = None
+        if connection is not None:
+            try:
+                tat = _advance_shared_rate_tat(connection, now, interval)
+            except sqlite3.Error as e:
+                log.warning("Shared NBA API rate limit unavailable, pacing this worker alone: %s", e)
+        if tat is None:
+            tat = _rate_tat
+            _rate_tat = max(tat, now) + interval
+    return max(now, tat - (API_RATE_BURST - 1) * interval) - now
+
+async def _wait_for_rate_limit():
+    """Sleep until the next request fits in the rate limit."""
+    # The slot is reserved before sleeping, so concurrent callers queue up behind each other
+    delay = await asyncio.to_thread(_reserve_rate_slot)
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+def _api_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _api_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _api_semaphores[loop] = asyncio.Semaphore(API_MAX_CONCURRENCY)
+    return semaphore
+
+# After this many consecutive failures an endpoint is skipped for the cooldown, so a
+# degraded API costs one timeout per conversation instead of one per tool call
+BREAKER_FAIL_MAX = 5
+BREAKER_RESET_TIMEOUT = 30.0
+# endpoint path -> [consecutive failures, monotonic time the breaker opened]
+_breakers = {}
+
+class UpstreamDegradedError(Exception):
+    """Raised instead of calling an endpoint whose circuit breaker is open."""
+
+def _record_failure(path: str):
+    breaker = _breakers.setdefault(path, [0, 0.0])
+    breaker[0] += 1
+    if breaker[0] >= BREAKER_FAIL_MAX:
+        breaker[1] = time.monotonic()
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a rate-limited or failed request."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), API_MAX_RETRY_DELAY)
+        except ValueError:
+            pass
+    return min(0.5 * 2 ** attempt, API_MAX_RETRY_DELAY) + random.uniform(0, 0.3)
+
+async def _fetch(path: str, params: Optional[Dict] = None) -> bytes:
+    """GET a balldontlie endpoint over the pooled client, with retries and the circuit breaker.
+
+    Returns:
+        The raw JSON body
+
+    Raises:
+        UpstreamDegradedError: The endpoint failed repeatedly and is cooling down
+    """
+    breaker = _breakers.get(path)
+    if breaker is not None and breaker[0] >= BREAKER_FAIL_MAX:
+        if time.monotonic() - breaker[1] < BREAKER_RESET_TIMEOUT:
+            raise UpstreamDegradedError(f"upstream degraded, not calling {path}")
+        # Cooldown over: let this request through as a trial
+    try:
+        for attempt in range(API_MAX_RETRIES + 1):
+            async with _api_semaphore():
+                await _wait_for_rate_limit()
+                response = await _http_client().get(f"/{path}", params=params)
+            if response.status_code not in API_RETRY_STATUSES or attempt == API_MAX_RETRIES:
+                break
+            await asyncio.sleep(_retry_delay(response, attempt))
+    except httpx.TransportError:
+        _record_failure(path)
+        raise
+    if response.status_code in API_RETRY_STATUSES:
+        _record_failure(path)
+    else:
+        _breakers.pop(path, None)
+    response.raise_for_status()
+    return response.content
+
+####################################
+# On-disk response cache
+####################################
+
+# Responses survive restarts and are shared by every uvicorn worker. Fresh entries skip
+# the network; stale ones are only served when the API cannot answer
+API_CACHE_PATH = Path(os.getenv("DATA_DIR", BACKEND_DIR / "data")) / "nba_api_cache.db"
+API_CACHE_MAX_AGE = 3600
+# Scores and odds move on game days
+API_CACHE_MAX_AGE_BY_PATH = {"nba/v1/games": 300, "nba/v1/odds": 300}
+# Older entries are too stale to serve even during an outage, and are pruned from the file
+API_CACHE_MAX_STALE_AGE = 24 * API_CACHE_MAX_AGE
+# Every worker writes to the same file; a lock held longer than this is treated as a miss
+# rather than holding up the tool call
+API_CACHE_BUSY_TIMEOUT = 0.5
+
+_api_cache_connection = None
+# Worker threads share the connection, so every use of it takes this lock
+_api_cache_lock = threading.Lock()
+_api_cache_pruned_at = 0.0
+
+def _connect_api_cache() -> sqlite3.Connection:
+    """Open a connection to the cache file, creating its tables if they are missing."""
+    API_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(
+        API_CACHE_PATH, timeout=API_CACHE_BUSY_TIMEOUT, check_same_thread=False, isolation_level=None,
+    )
+    connection.execute("PRAGMA journal_mode=WAL")
+    # Losing the last writes in a power cut only costs a refetch, so skip the per-commit fsync
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS responses "
+        "(key TEXT PRIMARY KEY, body BLOB NOT NULL, stored_at REAL NOT NULL)"
+    )
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS warm_ups (name TEXT PRIMARY KEY, started_at REAL NOT NULL)"
+    )
+    connection.execute("CREATE TABLE IF NOT EXISTS rate_limit (name TEXT PRIMARY KEY, tat REAL NOT NULL)")
+    return connection
+
+def _api_cache():
+    """Open the SQLite response cache on first use; None if it cannot be opened."""
+    global _api_cache_connection
+    with _api_cache_lock:
+        if _api_cache_connection is None:
+            try:
+                _api_cache_connection = _connect_api_cache()
+            except (OSError, sqlite3.Error) as e:
+                log.warning("NBA API disk cache disabled: %s", e)
+                _api_cache_connection = False
+    return _api_cache_connection or None
+
+def _read_api_cache(key: str):
+    connection = _api_cache()
+    if connection is None:
+        return None
+    try:
+        with _api_cache_lock:
+            return connection.execute("SELECT body, stored_at FROM responses WHERE key = ?", (key,)).fetchone()
+    except sqlite3.Error as e:
+        log.warning("NBA API disk cache read failed: %s", e)
+        return None
 
-def get_player_info(player_first_name: str, player_last_name: str) -> Dict:
+def _write_api_cache(key: str, body: bytes):
+    global _api_cache_pruned_at
+    connection = _api_cache()
+    if connection is None:
+        return
+    try:
+        with _api_cache_lock:
+            now = time.time()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, body, stored_at) VALUES (?, ?, ?)",
+                (key, body, now),
+            )
+            # Entries no request will be served from again are dropped about once an hour
+            if now - _api_cache_pruned_at > API_CACHE_MAX_AGE:
+                _api_cache_pruned_at = now
+                connection.execute("DELETE FROM responses WHERE stored_at < ?", (now - API_CACHE_MAX_STALE_AGE,))
+    except sqlite3.Error as e:
+        log.warning("NBA API disk cache write failed: %s", e)
+
+def _claim_warm_up() -> bool:
+    """Claim the warm-up for this worker; False if another worker started one within the hour.
+
+    The check and the claim are one statement, so workers starting together cannot both win.
+    """
+    connection = _api_cache()
+    if connection is None:
+        return True
+    now = time.time()
+    try:
+        with _api_cache_lock:
+            cursor = connection.execute(
+                "INSERT INTO warm_ups (name, started_at) VALUES ('nba_tools', ?) "
+                "ON CONFLICT (name) DO UPDATE SET started_at = excluded.started_at WHERE started_at < ?",
+                (now, now - API_CACHE_MAX_AGE),
+            )
+    except sqlite3.Error as e:
+        log.warning("NBA API disk cache warm-up claim failed: %s", e)
+        return False
+    return cursor.rowcount == 1
+
+async def _api_get(path: str, params: Optional[Dict] = None) -> Dict:
+    """GET a balldontlie endpoint, through the on-disk response cache.
+
+    Args:
+        path: Endpoint path (e.g., "nba/v1/teams")
+        params: Query parameters; list values go under "key[]" names
+
+    Returns:
+        Dict with the decoded JSON response
+
+    Raises:
+        UpstreamDegradedError: The endpoint failed repeatedly and is cooling down
+    """
+    key = f"{path}?{urlencode(sorted(params.items()), doseq=True)}" if params else path
+    # The cache blocks on disk I/O and on other workers' writes, so it is read and written
+    # from a worker thread
+    cached_row = await asyncio.to_thread(_read_api_cache, key)
+    if cached_row is not None and time.time() - cached_row[1] < API_CACHE_MAX_AGE_BY_PATH.get(path, API_CACHE_MAX_AGE):
+        return orjson.loads(cached_row[0])
+    try:
+        body = await _fetch(path, params)
+    except (httpx.HTTPError, UpstreamDegradedError) as e:
+        # Past the stale limit the entry is too old to stand in; a 4xx other than a rate limit
+        # is the API's real answer, not an outage
+        if cached_row is None or time.time() - cached_row[1] >= API_CACHE_MAX_STALE_AGE or (
+            isinstance(e, httpx.HTTPStatusError) and e.response.status_code not in API_RETRY_STATUSES
+        ):
+            raise
+        log.warning("Serving stale %s from the disk cache: %s", key, e)
+        return orjson.loads(cached_row[0])
+    await asyncio.to_thread(_write_api_cache, key, body)
+    # orjson decodes the larger standings and games payloads several times faster than json
+    return orjson.loads(body)
+
+def _data(response: Dict) -> List:
+    """Return the "data" list of an API response, or [] when it has none."""
+    return response.get("data") or []
+
+def _team_projection(team: Dict) -> Dict:
+    """The team fields a nested player or game entry needs to name the team"""
+    return {"id": team["id"], "name": team["name"], "full_name": team["full_name"]}
+
+def _player_projection(player: Dict) -> Dict:
+    """Keep the player fields get_player_info promises, dropping draft and college details"""
+    team = player.get("team")
+    return {
+        "id": player["id"],
+        "first_name": player["first_name"],
+        "last_name": player["last_name"],
+        "position": player.get("position"),
+        "height": player.get("height"),
+        "weight": player.get("weight"),
+        "jersey_number": player.get("jersey_number"),
+        "team": _team_projection(team) if team else None,
+    }
+
+def _game_projection(game: Dict) -> Dict:
+    """Keep a game's schedule and final score, with each team cut down to its id and names"""
+    return {
+        "id": game["id"],
+        "date": game["date"],
+        "season": game.get("season"),
+        "status": game.get("status"),
+        "postseason": game.get("postseason"),
+        "home_team": _team_projection(game["home_team"]),
+        "visitor_team": _team_projection(game["visitor_team"]),
+        "home_team_score": game["home_team_score"],
+        "visitor_team_score": game["visitor_team_score"],
+    }
+
+def _log_tool_error(function_name: str, error: Exception, *arguments):
+    """Log an exception swallowed by a tool, with the arguments it was called with;
+    call from inside the except block.
+
+    An error status from the API is an expected outcome (bad name, rate limit), so only
+    unexpected errors pay for formatting a traceback.
+    """
+    if not log.isEnabledFor(logging.WARNING):
+        return
+    call = "%s(%s)" % (function_name, ", ".join(map(repr, arguments)))
+    if isinstance(error, (httpx.HTTPStatusError, UpstreamDegradedError)):
+        log.warning("%s failed: %s", call, error)
+    else:
+        log.exception("%s failed", call)
+
+def _evict_failed(cache, key, task: asyncio.Future):
+    """Drop a cached task that failed, so the next call tries again."""
+    if task.cancelled() or task.exception() is not None:
+        if cache.get(key) is task:
+            del cache[key]
+
+def _async_cached(cache):
+    """Like cachetools.cached, for coroutine functions, with concurrent calls coalesced.
+
+    The cache holds a task per key rather than the coroutine, which can only be awaited once.
+    Calls that arrive while the task is still running await the same task, so concurrent cold
+    calls make one request. Exceptions are not cached.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args):
+            key = hashkey(*args)
+            task = cache.get(key)
+            if task is not None and task.done():
+                return task.result()
+            # A task still running on another event loop cannot be awaited from this one
+            if task is None or task.get_loop() is not asyncio.get_running_loop():
+                task = asyncio.create_task(func(*args))
+                cache[key] = task
+                task.add_done_callback(functools.partial(_evict_failed, cache, key))
+            # Shielded, so one caller being cancelled does not cancel the others' result
+            return await asyncio.shield(task)
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+# The team list is refreshed daily so a long-running server picks up renames
+TEAMS_CACHE = TTLCache(maxsize=1, ttl=86400)
+# Player searches are remembered per name for a few minutes, which covers a conversation
+# asking about the same player again without holding on to a player's team after a trade
+PLAYERS_CACHE = TTLCache(maxsize=512, ttl=300)
+# Results that change at most a few times a day are kept for an hour
+STANDINGS_CACHE = TTLCache(maxsize=64, ttl=3600)
+INJURIES_CACHE = TTLCache(maxsize=1, ttl=3600)
+# Lines keep moving until tip-off, so odds for a date are only reused for a few minutes
+ODDS_BY_DATE_CACHE = TTLCache(maxsize=256, ttl=300)
+
+# Nicknames and shorthand the API's team names do not contain, mapped to the
+# casefolded team name they refer to (abbreviations such as "GSW" are indexed already)
+_TEAM_ALIASES = {
+    "sixers": "76ers",
+    "philly": "76ers",
+    "dubs": "warriors",
+    "golden state": "warriors",
+    "la lakers": "lakers",
+    "l.a. lakers": "lakers",
+    "clips": "clippers",
+    "la clippers": "clippers",
+    "l.a. clippers": "clippers",
+    "nola": "pelicans",
+    "pels": "pelicans",
+    "blazers": "trail blazers",
+    "portland": "trail blazers",
+    "wolves": "timberwolves",
+    "t-wolves": "timberwolves",
+    "twolves": "timberwolves",
+    "mavs": "mavericks",
+    "cavs": "cavaliers",
+    "celts": "celtics",
+    "c's": "celtics",
+    "grizz": "grizzlies",
+    "nugs": "nuggets",
+    "wiz": "wizards",
+    "raps": "raptors",
+    "okc": "thunder",
+    "sac": "kings",
+    "ny knicks": "knicks",
+}
+
+def _team_query(team_name: str) -> str:
+    """Casefold a team name for lookup, resolving known nicknames to the team's name."""
+    query = team_name.strip().casefold()
+    return _TEAM_ALIASES.get(query, query)
+
+@_async_cached(TEAMS_CACHE)
+async def _all_teams_cached():
+    """Fetch the team list at most once a day.
+
+    Returns:
+        Tuple of (teams, index, search_names, names_in_text) where index maps each casefolded name,
+        full name, abbreviation and unshared city to its team, search_names holds
+        (full_name, name, team) with both names already casefolded for substring matching, and
+        names_in_text is a (pattern, index) pair that finds team names and nicknames inside a
+        longer query in one pass
+    """
+    response = await _api_get("nba/v1/teams")
+    teams = _data(response)
+    index = {}
+    search_names = []
+    for team in teams:
+        full_name = team["full_name"].casefold()
+        name = team["name"].casefold()
+        index[name] = team
+        index[full_name] = team
+        if team.get("abbreviation"):
+            index[team["abbreviation"].casefold()] = team
+        search_names.append((full_name, name, team))
+    # "Los Angeles" names two teams, so shared cities are left to the scan to report as ambiguous
+    cities = Counter((team.get("city") or "").casefold() for team in teams)
+    for team in teams:
+        city = (team.get("city") or "").casefold()
+        if city and cities[city] == 1:
+            index.setdefault(city, team)
+    # Abbreviations are left out of the pattern since "was" or "den" are also ordinary words
+    abbreviations = {team["abbreviation"].casefold() for team in teams if team.get("abbreviation")}
+    text_index = {key: team for key, team in index.items() if key not in abbreviations}
+    for alias, target in _TEAM_ALIASES.items():
+        if target in index:
+            text_index[alias] = index[target]
+    # Longest names first, so "golden state warriors" wins over "warriors" at the same position
+    pattern = re.compile(r"\b(?:%s)\b" % "|".join(
+        re.escape(key) for key in sorted(text_index, key=len, reverse=True)
+    ))
+    return teams, index, tuple(search_names), (pattern, text_index)
+
+@_async_cached(PLAYERS_CACHE)
+async def _search_players_cached(first_name: str, last_name: str):
+    """Search players by normalized first and last name, remembering the projected results."""
+    response = await _api_get("nba/v1/players", {"first_name": first_name, "last_name": last_name})
+    # Projected before caching, so the cache does not keep draft and college details alive
+    return [_player_projection(player) for player in _data(response)]
+
+@_async_cached(STANDINGS_CACHE)
+async def _standings_cached(season: int):
+    response = await _api_get("nba/v1/standings", {"season": season})
+    return _data(response)
+
+@_async_cached(INJURIES_CACHE)
+async def _injuries_cached():
+    response = await _api_get("nba/v1/player_injuries")
+    return _data(response)
+
+@_async_cached(ODDS_BY_DATE_CACHE)
+async def _odds_by_date_cached(game_date: str):
+    response = await _api_get("nba/v1/odds", {"date": game_date})
+    return _data(response)
+
+def _current_season() -> int:
+    """The season in progress, named by the year it started (seasons tip off in October)."""
+    today = datetime.now()
+    return today.year if today.month >= 10 else today.year - 1
+
+async def warm_up():
+    """Prefetch the endpoints that change rarely so the first tool calls hit a warm cache.
+
+    Meant to run as a background task on the event loop that serves the tools. Every uvicorn
+    worker calls it at startup, but only the first to claim the warm-up fetches; the others
+    find the responses in the shared disk cache on their first tool call.
+    """
+    if not await asyncio.to_thread(_claim_warm_up):
+        log.debug("NBA tools warm-up already claimed by another worker")
+        return
+    results = await asyncio.gather(
+        _all_teams_cached(),
+        _standings_cached(_current_season()),
+        _injuries_cached(),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            log.warning("NBA tools warm-up request failed: %s", result)
+
+async def get_player_info(player_first_name: str, player_last_name: str) -> Dict:
     """Get detailed information about an NBA player.
 
     Args:
@@ -188,7 +757,7 @@ def get_player_info(player_first_name: str, player_last_name: str) -> Dict:
     Returns:
         Dict containing player information including id, name, position, height, weight, etc.
     """
-    debug_print(f"\n[DEBUG] get_player_info() called with player_first_name: {player_first_name}, player_last_name: {player_last_name}")
+    log.debug("get_player_info() called with player_first_name: %s, player_last_name: %s", player_first_name, player_last_name)
     try:
         # Input validation
         if not player_first_name or not player_last_name:
@@ -196,46 +765,38 @@ def get_player_info(player_first_name: str, player_last_name: str) -> Dict:
         
         if USE_MOCK_DATA:
             # Search through mock players
+            first_needle = player_first_name.casefold()
+            last_needle = player_last_name.casefold()
+            player = _MOCK_PLAYER_INDEX.get(f"{first_needle} {last_needle}")
+            if player is not None:
+                log.debug("Found mock player: %s", player)
+                return player
             for player in MOCK_PLAYERS:
-                full_name = f"{player['first_name']} {player['last_name']}"
-                if player_first_name.lower() in full_name.lower() and player_last_name.lower() in full_name.lower():
-                    debug_print(f"[DEBUG] Found mock player: {player}")
+                full_name = f"{player['first_name']} {player['last_name']}".casefold()
+                if first_needle in full_name and last_needle in full_name:
+                    log.debug("Found mock player: %s", player)
                     return player
-            debug_print(f"[DEBUG] No mock player found with name: {player_first_name} {player_last_name}")
+            log.debug("No mock player found with name: %s %s", player_first_name, player_last_name)
             return {"error": f"No player found with name {player_first_name} {player_last_name}"}
         
-        # Real API call
-        response = api.nba.players.list(search=f"{player_first_name}")
-        debug_print(f"[DEBUG] API Response: {response}")
-        
-        print("-"*64)
-        print(f"\n\n\n API Response:\n {response}\n\n\n")
-        print("-"*64)
+        # Real API call, filtered on both names and cached per normalized name
+        players = await _search_players_cached(player_first_name.strip().casefold(), player_last_name.strip().casefold())
         
-        # Access the data field of the paginated response
-        players = response.data if hasattr(response, 'data') else []
-        
-        print("-"*64)
-        print(f"\n\n\n API Response DATA:\n {response.data}\n\n\n")
-        print("-"*64)
+        log.debug("API response data: %s", players)
         
         if not players:
-            debug_print(f"[DEBUG] No player found with name: {player_first_name} {player_last_name}")
+            log.debug("No player found with name: %s %s", player_first_name, player_last_name)
             return {"error": f"No player found with name {player_first_name} {player_last_name}"}
         
         # Return the first (most relevant) match
         player = players[0]
-        debug_print(f"[DEBUG] Found player: {player}")
-        debug_print(f"[DEBUG] Player type: {type(player)}")
-        debug_print(f"[DEBUG] Player attributes: {dir(player)}")
+        log.debug("Found player: %s", player)
         return player
     except Exception as e:
-        debug_print(f"[ERROR] Error in get_player_info(): {str(e)}")
-        debug_print("[DEBUG] Full error traceback:")
-        traceback.print_exc()
+        _log_tool_error("get_player_info", e, player_first_name, player_last_name)
         return {"error": f"Error fetching player info: {str(e)}"}
 
-def get_team_info(team_name: str) -> Dict:
+async def get_team_info(team_name: str) -> Dict:
     """Get detailed information about an NBA team.
 
     Args:
@@ -244,7 +805,7 @@ def get_team_info(team_name: str) -> Dict:
     Returns:
         Dict containing team information including id, full_name, conference, division, etc.
     """
-    print(f"\n[DEBUG] get_team_info() called with team_name: {team_name}")
+    log.debug("get_team_info() called with team_name: %s", team_name)
     try:
         # Input validation
         if not team_name:
@@ -252,48 +813,113 @@ def get_team_info(team_name: str) -> Dict:
         
         if USE_MOCK_DATA:
             # Search through mock teams
-            matching_teams = []
+            needle = team_name.casefold()
+            team = _MOCK_TEAM_INDEX.get(needle)
+            if team is not None:
+                log.debug("Found mock team: %s", team)
+                return team
+            # A second match already means the name is ambiguous
+            matching_team = None
             for team in MOCK_TEAMS:
-                if team_name.lower() in team["full_name"].lower() or team_name.lower() in team["name"].lower():
-                    matching_teams.append(team)
+                if needle in team["full_name"].casefold() or needle in team["name"].casefold():
+                    if matching_team is not None:
+                        return {"error": "Multiple teams found. Please use full team name."}
+                    matching_team = team
             
-            if len(matching_teams) > 1:
-                return {"error": "Multiple teams found. Please use full team name."}
-            elif len(matching_teams) == 1:
-                print(f"[DEBUG] Found mock team: {matching_teams[0]}")
-                return matching_teams[0]
+            if matching_team is not None:
+                log.debug("Found mock team: %s", matching_team)
+                return matching_team
             else:
-                print(f"[DEBUG] No mock team found with name: {team_name}")
+                log.debug("No mock team found with name: %s", team_name)
                 return {"error": f"No team found with name {team_name}"}
         
-        # Real API call
-        response = api.nba.teams.list()
-        teams = response.data if hasattr(response, 'data') else []
+        # Real API call, made at most once a day
+        teams, teams_by_name, team_search_names, (names_pattern, teams_by_text) = await _all_teams_cached()
         # print(f"[DEBUG] Found {len(teams)} teams in total")
         # print(f"[DEBUG] Teams: {teams}")
         
-        matching_teams = []
-        for team in teams:
-            # print(f"[DEBUG] Team: {team}")
-            if team_name.lower() in team.full_name.lower() or team_name.lower() in team.name.lower():
-                matching_teams.append(team)
-        
-        if len(matching_teams) > 1:
-            return {"error": "Multiple teams found. Please use full team name."}
-        elif len(matching_teams) == 1:
-            print(f"[DEBUG] Found matching team: {matching_teams[0]}")
-            return matching_teams[0]
+        # An exact name, full name or abbreviation needs no scan
+        query = _team_query(team_name)
+        team = teams_by_name.get(query)
+        if team is not None:
+            log.debug("Found matching team: %s", team)
+            return team
+        
+        # Partial names are matched against the names casefolded when the list was cached;
+        # a second match already means the name is ambiguous
+        matching_team = None
+        for full_name, name, team in team_search_names:
+            if query in full_name or query in name:
+                if matching_team is not None:
+                    return {"error": "Multiple teams found. Please use full team name."}
+                matching_team = team
+        if matching_team is None:
+            # The query may instead contain a team's name ("the celtics game"); one regex pass
+            # finds every name and nickname in it
+            for match in names_pattern.finditer(query):
+                team = teams_by_text[match.group()]
+                if matching_team is not None and team["id"] != matching_team["id"]:
+                    return {"error": "Multiple teams found. Please use full team name."}
+                matching_team = team
+        
+        if matching_team is not None:
+            log.debug("Found matching team: %s", matching_team)
+            return matching_team
         else:
-            print(f"[DEBUG] No team found with name: {team_name}")
+            log.debug("No team found with name: %s", team_name)
             return {"error": f"No team found with name {team_name}"}
     except Exception as e:
-        print(f"[ERROR] Error in get_team_info(): {str(e)}")
-        print("[DEBUG] Full error traceback:")
-        traceback.print_exc()
+        _log_tool_error("get_team_info", e, team_name)
         return {"error": f"Error fetching team info: {str(e)}"}
+
+async def get_teams_info(team_names: List[str]) -> List[Dict]:
+    """Get information about several NBA teams with a single team list lookup.
+
+    Args:
+        team_names: Names of the teams (e.g., ["Warriors", "Boston Celtics"])
+
+    Returns:
+        List with one team dict (or an error) per name, in order
+    """
+    log.debug("get_teams_info() called with team_names: %s", team_names)
+    if USE_MOCK_DATA:
+        return [await get_team_info(team_name) for team_name in team_names]
+    try:
+        _, teams_by_name, _, _ = await _all_teams_cached()
+    except Exception as e:
+        _log_tool_error("get_teams_info", e, team_names)
+        return [{"error": f"Error fetching team info: {str(e)}"} for _ in team_names]
+    # Exact names are answered from the index; the rest take get_team_info's scans of the
+    # same cached list, so no name costs another request
+    return [
+        (teams_by_name.get(_team_query(team_name)) if team_name else None)
+        or await get_team_info(team_name)
+        for team_name in team_names
+    ]
     
     
-def get_game_info(
+def _team_id(team_name: str, teams) -> Optional[int]:
+    """Resolve a team name to its ID through the cached index, then the first partial match,
+    then the first team named inside the query.
+
+    Args:
+        team_name: Name as given by the caller
+        teams: The value of _all_teams_cached()
+    """
+    _, teams_by_name, team_search_names, (names_pattern, teams_by_text) = teams
+    query = _team_query(team_name)
+    team = teams_by_name.get(query)
+    if team is None:
+        team = next(
+            (team for full_name, name, team in team_search_names if query in full_name or query in name),
+            None,
+        )
+    if team is None:
+        match = names_pattern.search(query)
+        team = teams_by_text[match.group()] if match else None
+    return team["id"] if team is not None else None
+
+async def get_game_info(
     season: Optional[int] = None,
     home_team: Optional[str] = None,
     away_team: Optional[str] = None
@@ -311,10 +937,10 @@ def get_game_info(
             If None, results are not filtered by away team.
 
     Returns:
-        Dict: Game information including period, start_time, time_in_period, etc.
+        Dict: Game information including date, status, both teams and the final score.
     """
 
-    print(f"\n[DEBUG] get_game_info() called with season: {season}, home_team: {home_team}, away_team: {away_team} ")
+    log.debug("get_game_info() called with season: %s, home_team: %s, away_team: %s", season, home_team, away_team)
     try:
         # Input validation
         if season != None:
@@ -327,106 +953,66 @@ def get_game_info(
         
         if USE_MOCK_DATA:
             # Search through mock games
-            matching_games = []
-            for game in MOCK_GAMES:
-                if home_team and away_team:
-                    if (game["home_team"]["name"].lower() == home_team.lower() and 
-                    game["visitor_team"]["name"].lower() == away_team.lower()):
-                        matching_games.append(game)
-                elif home_team and not away_team:
-                    if (game["home_team"]["name"].lower() == home_team.lower()):
-                        matching_games.append(game)
-                elif not home_team and away_team:
-                    if (game["visitor_team"]["name"].lower() == away_team.lower()):
-                        matching_games.append(game)
-                else:
-                    matching_games.append(game)
+            # Names resolve through the mock team index once; games are then matched by ID
+            home = _MOCK_TEAM_INDEX.get(home_team.casefold(), {}) if home_team else None
+            away = _MOCK_TEAM_INDEX.get(away_team.casefold(), {}) if away_team else None
+            matching_games = [
+                game for game in MOCK_GAMES
+                if (home is None or game["home_team"]["id"] == home.get("id"))
+                and (away is None or game["visitor_team"]["id"] == away.get("id"))
+            ]
             
             if len(matching_games) >= 1:
-                print(f"[DEBUG] Found matching mock games: {matching_games}")
+                log.debug("Found matching mock games: %s", matching_games)
                 return matching_games
             else:
-                print(f"[DEBUG] No mock games found")
+                log.debug("No mock games found")
                 return {"error": f"No games found"}
         
-        # get team id's first
-        response = api.nba.teams.list()
-        teams = response.data if hasattr(response, 'data') else []
-        # print(f"[DEBUG] Found {len(teams)} teams in total")
-        # print(f"[DEBUG] Teams: {teams}")
+        # get team id's first, so the API only returns games involving those teams
+        teams = await _all_teams_cached()
+        home_team_id = _team_id(home_team, teams) if home_team else None
+        away_team_id = _team_id(away_team, teams) if away_team else None
+        if (home_team and home_team_id is None) or (away_team and away_team_id is None):
+            log.debug("No team found for home_team: %s, away_team: %s", home_team, away_team)
+            return {"error": f"No games found"}
         
-        home_team_id = -1
-        away_team_id = -1
-        for team in teams:
-            # print(f"[DEBUG] Team: {team}")
+        team_ids = [team_id for team_id in (home_team_id, away_team_id) if team_id is not None]
             
-            if home_team != None:
-                if home_team.lower() in team.full_name.lower() or home_team.lower() in team.name.lower():
-                    home_team_id = team.id
-            if away_team != None:
-                if away_team.lower() in team.full_name.lower() or away_team.lower() in team.name.lower():
-                    away_team_id = team.id
-        
-        team_ids = []
-        if home_team_id > 0:
-            team_ids.append(home_team_id)
-        if away_team_id > 0:
-            team_ids.append(away_team_id)
-            
-        # Real API call with pagination
-        all_games = []
-        next_cursor = None
-        per_page = 100  # Maximum allowed by the API
-        
-        # while True:
-            # Make API request with current cursor
-        params = {
-            "team_ids": team_ids,
-            "per_page": per_page
-        }
-        
+        if season != None and team_ids:
+            # Two teams' seasons run past one page, so follow the cursor to the end
+            all_games = await _season_games_for_teams(team_ids, season)
+        else:
+            params = {
+                "team_ids[]": team_ids,
+                "per_page": 100  # Maximum allowed by the API
+            }
+            if season != None:
+                params["seasons[]"] = [season]
+            response = await _api_get("nba/v1/games", params)
+            all_games = _data(response)
         
-        if season != None:
-            params["seasons"] = [season]
+        log.debug("Retrieved %d games in total", len(all_games))
         
-        # if next_cursor is not None:
-        #     params["cursor"] = next_cursor
-            
-        response = api.nba.games.list(**params)
-        all_games = response.data if hasattr(response, 'data') else  []
-        
-        print(f"[DEBUG] Retrieved {len(all_games)} games in total")
-        
-        # Filter games by home and away team
-        matching_games = []
-        for game in all_games:
-            if home_team and away_team:
-                if (home_team.lower() in game.home_team.name.lower() and 
-                    away_team.lower() in game.visitor_team.name.lower()):
-                    matching_games.append(game)
-            elif home_team and not away_team:
-                if (home_team.lower() in game.home_team.name.lower()):
-                    matching_games.append(game)
-            elif not home_team and away_team:
-                if (away_team.lower() in game.visitor_team.name.lower()):
-                    matching_games.append(game)
-            else:
-                matching_games.append(game)
+        # team_ids[] matches games involving either team, so home and visitor are told apart here
+        matching_games = [
+            game for game in all_games
+            if (home_team_id is None or game["home_team"]["id"] == home_team_id)
+            and (away_team_id is None or game["visitor_team"]["id"] == away_team_id)
+        ]
         
         if len(matching_games) >= 1:
-            print(f"[DEBUG] Found {len(matching_games)} matching games")
-            return matching_games
+            log.debug("Found %d matching games", len(matching_games))
+            return [_game_projection(game) for game in matching_games]
         else:
-            print(f"[DEBUG] No matching games found")
+            log.debug("No matching games found")
             return {"error": f"No games found"}
             
     except Exception as e:
-        print(f"[ERROR] Error in get_game_info(): {str(e)}")
-        print("[DEBUG] Full error traceback:")
-        traceback.print_exc()
+        _log_tool_error("get_game_info", e, season, home_team, away_team)
         return {"error": f"Error fetching game info: {str(e)}"}
 
-def get_team_standings(season: int) -> Dict:
+async def get_team_standings(season: int) -> Dict:
     """Get the current NBA standings for a specific season.
 
     Args:
@@ -435,7 +1021,7 @@ def get_team_standings(season: int) -> Dict:
     Returns:
         Dict containing standings information for all teams including wins, losses, conference rank, etc.
     """
-    print(f"\n[DEBUG] get_team_standings() called with season: {season}")
+    log.debug("get_team_standings() called with season: %s", season)
     try:
         # Input validation
         current_year = datetime.now().year
@@ -443,29 +1029,18 @@ def get_team_standings(season: int) -> Dict:
             return {"error": f"Invalid year. Please use a year between 2000 and {current_year}"}
         
         if USE_MOCK_DATA:
-            print(f"[DEBUG] Returning mock standings for {season} season")
+            log.debug("Returning mock standings for %s season", season)
             return MOCK_STANDINGS
         
-        # Real API call
-        response = api.nba.standings.get(season=season)
-        standings = response.data if hasattr(response, 'data') else []
-        print(f"[DEBUG] Retrieved standings for {season} season with {len(standings)} teams")
+        # Real API call, cached per season
+        standings = await _standings_cached(season)
+        log.debug("Retrieved standings for %s season with %d teams", season, len(standings))
         return standings
     except Exception as e:
-        print(f"[ERROR] Error in get_team_standings(): {str(e)}")
-        print("[DEBUG] Full error traceback:")
-        traceback.print_exc()
+        _log_tool_error("get_team_standings", e, season)
         return {"error": f"Error fetching standings: {str(e)}"}
 
-# TODO: FIX get_player_season_stats
-
-# Traceback (most recent call last):
-#   File "/Users/oga/Desktop/gwu_stuff/Masters Stuff/Capstone/SportsLLM/open-webui/backend/open_webui/nba_tools.py", line 133, in get_player_season_stats
-#     response = api.nba.season_averages.get(
-#                ^^^^^^^^^^^^^^^^^^^^^^^^^^^^
-# TypeError: NBASeasonAveragesAPI.get() got an unexpected keyword argument 'player_ids'
-
-def get_player_season_stats(player_name: str, season: int) -> Dict:
+async def get_player_season_stats(player_name: str, season: int) -> Dict:
     """Get a player's season averages for a specific season.
 
     Args:
@@ -475,35 +1050,30 @@ def get_player_season_stats(player_name: str, season: int) -> Dict:
     Returns:
         Dict containing player's season averages including points, rebounds, assists, etc.
     """
-    print(f"\n[DEBUG] get_player_season_stats() called with player_name: {player_name}, season: {season}")
+    log.debug("get_player_season_stats() called with player_name: %s, season: %s", player_name, season)
     try:
         # First get player ID
-        player = get_player_info(player_name)
-        if isinstance(player, dict) and "error" in player:
-            print(f"[DEBUG] Error finding player: {player['error']}")
+        first_name, _, last_name = player_name.strip().partition(" ")
+        player = await get_player_info(first_name, last_name)
+        if "error" in player:
+            log.debug("Error finding player: %s", player['error'])
             return player
         
-        print(f"[DEBUG] Found player ID: {player.id}")
-        # Get season averages
-        response = api.nba.season_averages.get(
-            season=season,
-            player_ids=[player.id]
-        )
-        stats = response.data if hasattr(response, 'data') else []
+        log.debug("Found player ID: %s", player["id"])
+        response = await _api_get("nba/v1/season_averages", {"season": season, "player_id": player["id"]})
+        stats = _data(response)
         
         if not stats:
-            print(f"[DEBUG] No stats found for player in season {season}")
+            log.debug("No stats found for player in season %s", season)
             return {"error": f"No stats found for {player_name} in {season} season"}
         
-        print(f"[DEBUG] Retrieved season stats: {stats[0]}")
+        log.debug("Retrieved season stats: %s", stats[0])
         return stats[0]
     except Exception as e:
-        print(f"[ERROR] Error in get_player_season_stats(): {str(e)}")
-        print("[DEBUG] Full error traceback:")
-        traceback.print_exc()
+        _log_tool_error("get_player_season_stats", e, player_name, season)
         return {"error": f"Error fetching season stats: {str(e)}"}
 
-def get_league_leaders(season: int, stat_type: str) -> List[Dict]:
+async def get_league_leaders(season: int, stat_type: str) -> List[Dict]:
     """Get the NBA statistical leaders for a specific category.
 
     Args:
@@ -513,7 +1083,7 @@ def get_league_leaders(season: int, stat_type: str) -> List[Dict]:
     Returns:
         List of dicts containing top players and their stats for the specified category
     """
-    print(f"\n[DEBUG] get_league_leaders() called with season: {season}, stat_type: {stat_type}")
+    log.debug("get_league_leaders() called with season: %s, stat_type: %s", season, stat_type)
     try:
         # Input validation
         if not stat_type or stat_type.strip() == "":
@@ -521,26 +1091,24 @@ def get_league_leaders(season: int, stat_type: str) -> List[Dict]:
         
         if USE_MOCK_DATA:
             if stat_type in MOCK_LEADERS:
-                print(f"[DEBUG] Returning mock leaders for {stat_type}")
+                log.debug("Returning mock leaders for %s", stat_type)
                 return MOCK_LEADERS[stat_type]
-            print(f"[DEBUG] No mock data for stat type: {stat_type}")
+            log.debug("No mock data for stat type: %s", stat_type)
             return {"error": f"No mock data available for stat type {stat_type}"}
         
         # Real API call
-        response = api.nba.leaders.get(
-            season=season,
-            stat_type=stat_type
-        )
-        leaders = response.data if hasattr(response, 'data') else []
-        print(f"[DEBUG] Retrieved {len(leaders)} leaders for {stat_type}")
+        response = await _api_get("nba/v1/leaders", {
+            "season": season,
+            "stat_type": stat_type
+        })
+        leaders = _data(response)
+        log.debug("Retrieved %d leaders for %s", len(leaders), stat_type)
         return leaders
     except Exception as e:
-        print(f"[ERROR] Error in get_league_leaders(): {str(e)}")
-        print("[DEBUG] Full error traceback:")
-        traceback.print_exc()
+        _log_tool_error("get_league_leaders", e, season, stat_type)
         return {"error": f"Error fetching league leaders: {str(e)}"}
 
-def get_game_odds(game_date: str = None, game_id: int = None) -> List[Dict]:
+async def get_game_odds(game_date: str = None, game_id: int = None) -> List[Dict]:
     """Get betting odds for NBA games.
 
     Args:
@@ -550,7 +1118,7 @@ def get_game_odds(game_date: str = None, game_id: int = None) -> List[Dict]:
     Returns:
         List of dicts containing betting odds information including moneyline, spread, and over/under
     """
-    print(f"\n[DEBUG] get_game_odds() called with game_date: {game_date}, game_id: {game_id}")
+    log.debug("get_game_odds() called with game_date: %s, game_id: %s", game_date, game_id)
     try:
         # Input validation
         if not game_date and not game_id:
@@ -563,9 +1131,8 @@ def get_game_odds(game_date: str = None, game_id: int = None) -> List[Dict]:
         if game_date:
             try:
                 # Validate date format
-                datetime.strptime(game_date, "%Y-%m-%d")
-                # Check if date is in the past
                 game_datetime = datetime.strptime(game_date, "%Y-%m-%d")
+                # Check if date is in the past
                 if game_datetime.date() < datetime.now().date():
                     return {"error": "No games found for the specified date"}
                 # Check if date is too far in the future
@@ -583,54 +1150,136 @@ def get_game_odds(game_date: str = None, game_id: int = None) -> List[Dict]:
             elif game_date:
                 # For mock data, we'll just return all odds since we don't have date filtering
                 odds = MOCK_ODDS
-            print(f"[DEBUG] Returning {len(odds)} mock odds")
+            log.debug("Returning %d mock odds", len(odds))
             return odds
         
         # Real API call
         if game_date:
-            response = api.nba.odds.list(date=game_date)
-            odds = response.data if hasattr(response, 'data') else []
-            if not odds:
-                return {"error": "No games found for the specified date"}
-            print(f"[DEBUG] Retrieved {len(odds)} odds for date {game_date}")
-        elif game_id:
-            response = api.nba.odds.list(game_id=game_id)
-            odds = response.data if hasattr(response, 'data') else []
-            if not odds:
-                return {"error": f"No game found with ID {game_id}"}
-            print(f"[DEBUG] Retrieved odds for game_id {game_id}")
-        
+            return await get_game_odds_by_date(game_date)
+        return await get_game_odds_by_game(game_id)
+    except Exception as e:
+        _log_tool_error("get_game_odds", e, game_date, game_id)
+        return {"error": f"Error fetching game odds: {str(e)}"}
+
+async def get_game_odds_by_date(game_date: str) -> List[Dict]:
+    """Get betting odds for every NBA game on a date.
+
+    Args:
+        game_date: Date of games in YYYY-MM-DD format (e.g., "2024-04-01")
+
+    Returns:
+        List of dicts containing betting odds information including moneyline, spread, and over/under
+    """
+    log.debug("get_game_odds_by_date() called with game_date: %s", game_date)
+    try:
+        odds = await _odds_by_date_cached(game_date)
+        if not odds:
+            return {"error": "No games found for the specified date"}
+        log.debug("Retrieved %d odds for date %s", len(odds), game_date)
+        return odds
+    except Exception as e:
+        _log_tool_error("get_game_odds_by_date", e, game_date)
+        return {"error": f"Error fetching game odds: {str(e)}"}
+
+async def get_game_odds_by_game(game_id: int) -> List[Dict]:
+    """Get betting odds for a single NBA game.
+
+    Args:
+        game_id: Specific game ID to get odds for
+
+    Returns:
+        List of dicts containing betting odds information including moneyline, spread, and over/under
+    """
+    log.debug("get_game_odds_by_game() called with game_id: %s", game_id)
+    try:
+        response = await _api_get("nba/v1/odds", {"game_id": game_id})
+        odds = _data(response)
+        if not odds:
+            return {"error": f"No game found with ID {game_id}"}
+        log.debug("Retrieved odds for game_id %s", game_id)
         return odds
     except Exception as e:
-        print(f"[ERROR] Error in get_game_odds(): {str(e)}")
-        print("[DEBUG] Full error traceback:")
-        traceback.print_exc()
+        _log_tool_error("get_game_odds_by_game", e, game_id)
         return {"error": f"Error fetching game odds: {str(e)}"}
 
-def get_player_injuries() -> List[Dict]:
+async def get_player_injuries() -> List[Dict]:
     """Get current NBA player injuries.
 
     Returns:
         List of dicts containing information about injured players including status and expected return
     """
-    print("\n[DEBUG] get_player_injuries() called")
+    log.debug("get_player_injuries() called")
     try:
         if USE_MOCK_DATA:
-            print(f"[DEBUG] Returning {len(MOCK_INJURIES)} mock injuries")
+            log.debug("Returning %d mock injuries", len(MOCK_INJURIES))
             return MOCK_INJURIES
         
-        # Real API call
-        response = api.nba.player_injuries.list()
-        injuries = response.data if hasattr(response, 'data') else []
-        print(f"[DEBUG] Retrieved {len(injuries)} player injuries")
+        # Real API call, cached
+        injuries = await _injuries_cached()
+        log.debug("Retrieved %d player injuries", len(injuries))
         return injuries
     except Exception as e:
-        print(f"[ERROR] Error in get_player_injuries(): {str(e)}")
-        print("[DEBUG] Full error traceback:")
-        traceback.print_exc()
+        _log_tool_error("get_player_injuries", e)
         return {"error": f"Error fetching player injuries: {str(e)}"}
 
-def get_head_to_head_stats(team1_name: str, team2_name: str, season: int) -> Dict:
+# Each pulls both fields out of a game in one C-level call
+_get_scores = itemgetter("home_team_score", "visitor_team_score")
+_get_teams = itemgetter("home_team", "visitor_team")
+
+def _count_wins(games: List[Dict], team_id: int) -> int:
+    """Count the games won by a team.
+
+    Args:
+        games: Games with home/visitor teams and scores
+        team_id: ID of the team whose wins are counted
+
+    Returns:
+        Number of games in which the team had the higher score
+    """
+    wins = 0
+    for game in games:
+        home_score, visitor_score = _get_scores(game)
+        home_team, visitor_team = _get_teams(game)
+        winner_id = home_team["id"] if home_score > visitor_score else visitor_team["id"]
+        if winner_id == team_id:
+            wins += 1
+    return wins
+
+async def _season_games_for_teams(team_ids, season: int) -> List[Dict]:
+    """Fetch every game of a season that involves any of the teams, following pagination."""
+    params = {
+        "team_ids[]": sorted(team_ids),
+        "seasons[]": [season],
+        "per_page": 100  # Maximum allowed by the API
+    }
+    games = []
+    while True:
+        response = await _api_get("nba/v1/games", params)
+        games.extend(_data(response))
+        next_cursor = (response.get("meta") or {}).get("next_cursor")
+        if not next_cursor:
+            return games
+        params["cursor"] = next_cursor
+
+def _games_by_pair(games: List[Dict]) -> Dict:
+    """Group games by the unordered pair of team IDs that played them."""
+    games_by_pair = defaultdict(list)
+    for game in games:
+        home_team, visitor_team = _get_teams(game)
+        games_by_pair[frozenset((home_team["id"], visitor_team["id"]))].append(game)
+    return games_by_pair
+
+def _head_to_head_summary(team1: Dict, team2: Dict, games: List[Dict]) -> Dict:
+    """Build the head-to-head stats dict for two teams from the games they played."""
+    team1_wins = _count_wins(games, team1["id"])
+    return {
+        "total_games": len(games),
+        f"{team1['name']}_wins": team1_wins,
+        f"{team2['name']}_wins": len(games) - team1_wins,
+        "games": [_game_projection(game) for game in games]
+    }
+
+async def get_head_to_head_stats(team1_name: str, team2_name: str, season: int) -> Dict:
     """Get head-to-head statistics between two teams for a specific season.
 
     Args:
@@ -641,102 +1290,119 @@ def get_head_to_head_stats(team1_name: str, team2_name: str, season: int) -> Dic
     Returns:
         Dict containing head-to-head statistics between the teams
     """
-    print(f"\n[DEBUG] get_head_to_head_stats() called with team1: {team1_name}, team2: {team2_name}, season: {season}")
+    log.debug("get_head_to_head_stats() called with team1: %s, team2: %s, season: %s", team1_name, team2_name, season)
     try:
         # Input validation
         if not team1_name or not team2_name:
             return {"error": "Both team names are required"}
         
-        if team1_name.lower() == team2_name.lower():
-            return {"error": "Cannot compare a team with itself"}
+        # Casefolded once here and reused for the mock lookups below
+        team1_key = team1_name.casefold()
+        team2_key = team2_name.casefold()
         
         current_year = datetime.now().year
         if not isinstance(season, int) or season < 2000 or season > current_year:
             return {"error": f"Invalid year. Please use a year between 2000 and {current_year}"}
         
         if USE_MOCK_DATA:
-            # Get team IDs from mock data
-            team1 = get_team_info(team1_name)
-            team2 = get_team_info(team2_name)
+            # Get team IDs from mock data; exact names come straight from the mock index
+            team1 = _MOCK_TEAM_INDEX.get(team1_key) or await get_team_info(team1_name)
+            team2 = _MOCK_TEAM_INDEX.get(team2_key) or await get_team_info(team2_name)
             
             if "error" in team1 or "error" in team2:
-                print("[DEBUG] One or both teams not found in mock data")
+                log.debug("One or both teams not found in mock data")
                 return {"error": "One or both teams not found"}
+            # Compared after resolution, since a nickname and a full name can name the same team
+            if team1["id"] == team2["id"]:
+                return {"error": "Cannot compare a team with itself"}
             
-            print(f"[DEBUG] Found team IDs - team1: {team1['id']}, team2: {team2['id']}")
+            log.debug("Found team IDs - team1: %s, team2: %s", team1['id'], team2['id'])
             
             # Filter mock games between these teams
             games = [game for game in MOCK_GAMES 
                     if (game["home_team"]["id"] == team1["id"] and game["visitor_team"]["id"] == team2["id"]) or
                        (game["home_team"]["id"] == team2["id"] and game["visitor_team"]["id"] == team1["id"])]
             
-            print(f"[DEBUG] Found {len(games)} mock games between teams")
-            
-            # Process head-to-head stats
-            stats = {
-                "total_games": len(games),
-                f"{team1['name']}_wins": 0,
-                f"{team2['name']}_wins": 0,
-                "games": games
-            }
-            
-            for game in games:
-                if game["home_team_score"] > game["visitor_team_score"]:
-                    winner_id = game["home_team"]["id"]
-                else:
-                    winner_id = game["visitor_team"]["id"]
-                    
-                if winner_id == team1["id"]:
-                    stats[f"{team1['name']}_wins"] += 1
-                else:
-                    stats[f"{team2['name']}_wins"] += 1
+            log.debug("Found %d mock games between teams", len(games))
             
-            print(f"[DEBUG] Final head-to-head stats: {stats}")
+            stats = _head_to_head_summary(team1, team2, games)
+            log.debug("Final head-to-head stats: %s", stats)
             return stats
         
         # Real API call
-        # Get team IDs
-        team1 = get_team_info(team1_name)
-        team2 = get_team_info(team2_name)
+        # Get team IDs from the cached team index, so the games request below is the
+        # only round trip; partial names fall back to get_team_info's scan of the same list
+        team1, team2 = await get_teams_info([team1_name, team2_name])
         
         if "error" in team1 or "error" in team2:
-            print("[DEBUG] One or both teams not found")
+            log.debug("One or both teams not found")
             return {"error": "One or both teams not found"}
+        if team1["id"] == team2["id"]:
+            return {"error": "Cannot compare a team with itself"}
         
-        print(f"[DEBUG] Found team IDs - team1: {team1['id']}, team2: {team2['id']}")
+        log.debug("Found team IDs - team1: %s, team2: %s", team1['id'], team2['id'])
         
-        # Get games between these teams
-        response = api.nba.games.list(
-            team_ids=[team1["id"], team2["id"]],
-            seasons=[season]
-        )
-        games = response.data if hasattr(response, 'data') else []
+        # Get games between these teams; the filter matches games of either team,
+        # so only the ones where they met are kept
+        all_games = await _season_games_for_teams({team1["id"], team2["id"]}, season)
+        games = _games_by_pair(all_games)[frozenset((team1["id"], team2["id"]))]
         
-        print(f"[DEBUG] Found {len(games)} games between teams")
+        log.debug("Found %d games between teams", len(games))
         
-        # Process head-to-head stats
-        stats = {
-            "total_games": len(games),
-            f"{team1['name']}_wins": 0,
-            f"{team2['name']}_wins": 0,
-            "games": games
-        }
+        stats = _head_to_head_summary(team1, team2, games)
+        log.debug("Final head-to-head stats: %s", stats)
+        return stats
+    except Exception as e:
+        _log_tool_error("get_head_to_head_stats", e, team1_name, team2_name, season)
+        return {"error": f"Error fetching head-to-head stats: {str(e)}"} 
+
+async def get_head_to_head_stats_batch(team_pairs: List[Tuple[str, str]], season: int) -> List[Dict]:
+    """Get head-to-head statistics for several pairs of teams in one season.
+
+    Args:
+        team_pairs: Pairs of team names (e.g., [("Lakers", "Warriors"), ("Celtics", "Heat")])
+        season: The season year (e.g., 2023 for 2023-24 season)
+
+    Returns:
+        List with one dict of head-to-head statistics (or an error) per pair, in order
+    """
+    log.debug("get_head_to_head_stats_batch() called with team_pairs: %s, season: %s", team_pairs, season)
+    try:
+        if USE_MOCK_DATA:
+            return [await get_head_to_head_stats(team1_name, team2_name, season) for team1_name, team2_name in team_pairs]
         
-        for game in games:
-            if game["home_team_score"] > game["visitor_team_score"]:
-                winner_id = game["home_team"]["id"]
-            else:
-                winner_id = game["visitor_team"]["id"]
-                
-            if winner_id == team1["id"]:
-                stats[f"{team1['name']}_wins"] += 1
-            else:
-                stats[f"{team2['name']}_wins"] += 1
+        current_year = datetime.now().year
+        if not isinstance(season, int) or season < 2000 or season > current_year:
+            return [{"error": f"Invalid year. Please use a year between 2000 and {current_year}"} for _ in team_pairs]
         
-        print(f"[DEBUG] Final head-to-head stats: {stats}")
-        return stats
+        # Resolve every pair first, so the games of all the teams come back in one query
+        teams = await get_teams_info([team_name for pair in team_pairs for team_name in pair])
+        resolved = []
+        for (team1_name, team2_name), team1, team2 in zip(team_pairs, teams[::2], teams[1::2]):
+            if not team1_name or not team2_name:
+                resolved.append({"error": "Both team names are required"})
+                continue
+            if "error" in team1 or "error" in team2:
+                resolved.append({"error": "One or both teams not found"})
+                continue
+            if team1["id"] == team2["id"]:
+                resolved.append({"error": "Cannot compare a team with itself"})
+                continue
+            resolved.append((team1, team2))
+        
+        team_ids = {team["id"] for pair in resolved if isinstance(pair, tuple) for team in pair}
+        games_by_pair = _games_by_pair(await _season_games_for_teams(team_ids, season)) if team_ids else {}
+        
+        results = []
+        for pair in resolved:
+            if isinstance(pair, dict):
+                results.append(pair)
+                continue
+            team1, team2 = pair
+            games = games_by_pair.get(frozenset((team1["id"], team2["id"])), [])
+            results.append(_head_to_head_summary(team1, team2, games))
+        log.debug("Final batched head-to-head stats: %s", results)
+        return results
     except Exception as e:
-        print(f"[ERROR] Error in get_head_to_head_stats(): {str(e)}")
-        print("[DEBUG] Full error traceback:")
-        traceback.print_exc()
-        return {"error": f"Error fetching head-to-head stats: {str(e)}"} 
\ No newline at end of file
+        _log_tool_error("get_head_to_head_stats_batch", e, team_pairs, season)
+        return [{"error": f"Error fetching head-to-head stats: {str(e)}"} for _ in team_pairs]
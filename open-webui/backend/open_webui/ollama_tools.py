@@ -1,6 +1,8 @@
+import asyncio
 import inspect
 import json
 import re
+import sys
 def generate_function_description(func):
     func_name = func.__name__
     docstring = func.__doc__
@@ -65,6 +67,19 @@ def generate_function_description(func):
 
 
 def use_tools(tools_calls, tool_functions):
+    """Run the tool calls from a model reply one after another.
+
+    Args:
+        tools_calls: Tool calls from the model message, each with a function name and arguments
+        tool_functions: Mapping of tool name to the sync callable that implements it
+
+    Returns:
+        The string form of each tool result, joined with newlines in call order
+
+    Raises:
+        KeyError: If a call names a tool that is not in tool_functions
+        TypeError: If the named tool is a coroutine function; use ause_tools instead
+    """
     tools_responses = []
     for tool_call in tools_calls:
         # Parse tool name and arguments
@@ -72,9 +87,49 @@ def use_tools(tools_calls, tool_functions):
         arguments = tool_call['function']['arguments']
 
         # Dynamically call the function
-        if tool_name in tool_functions:
-            result = tool_functions[tool_name](**arguments)
+        tool_function = tool_functions.get(sys.intern(tool_name))
+        if tool_function is not None:
+            if inspect.iscoroutinefunction(tool_function):
+                # A fresh event loop per call would also strand the tool's per-loop HTTP client
+                raise TypeError(f"Function {tool_name} is a coroutine function; call it through ause_tools.")
+            result = tool_function(**arguments)
             tools_responses.append(str(result))
         else:
             raise KeyError(f"Function {tool_name} not found in the provided tool functions.")
     return "\n".join(tools_responses)
+
+
+async def ause_tools(tools_calls, tool_functions):
+    """Run the tool calls from a model reply concurrently.
+
+    Coroutine tools are gathered directly on the running loop; sync tools run
+    via asyncio.to_thread so they cannot block it.
+
+    Args:
+        tools_calls: Tool calls from the model message, each with a function name and arguments
+        tool_functions: Mapping of tool name to the sync or coroutine callable that implements it
+
+    Returns:
+        The string form of each tool result, joined with newlines in call order
+
+    Raises:
+        KeyError: If a call names a tool that is not in tool_functions; no tool has run yet
+    """
+    # Resolve every call first so an unknown name fails before any tool has run
+    calls = []
+    for tool_call in tools_calls:
+        tool_name = tool_call['function']['name']
+        arguments = tool_call['function']['arguments']
+        tool_function = tool_functions.get(sys.intern(tool_name))
+        if tool_function is None:
+            raise KeyError(f"Function {tool_name} not found in the provided tool functions.")
+        calls.append((tool_function, arguments))
+
+    # All calls run at once; blocking tools get a worker thread so they cannot stall the loop
+    results = await asyncio.gather(*(
+        tool_function(**arguments)
+        if inspect.iscoroutinefunction(tool_function)
+        else asyncio.to_thread(tool_function, **arguments)
+        for tool_function, arguments in calls
+    ))
+    return "\n".join(str(result) for result in results)
@@ -1,7 +1,10 @@
 import unittest
+from unittest.mock import patch
+import nba_tools
 from nba_tools import (
     get_player_info,
     get_team_info,
+    get_teams_info,
     get_team_standings,
     get_league_leaders,
     get_game_odds,
@@ -15,150 +18,187 @@ from nba_tools import (
     MOCK_LEADERS,
     MOCK_GAMES,
     MOCK_ODDS,
-    MOCK_INJURIES,
     get_game_info
 )
+import argparse
+import os
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 class TestResult(unittest.TestResult):
     def __init__(self, stream=None, descriptions=None, verbosity=None):
         super().__init__(stream, descriptions, verbosity)
-        self.start_time = None
-        self.end_time = None
-        self.test_times = {}
-        self.test_descriptions = {}
+        self._start_times = {}  # test -> start, so tests on other threads can overlap
+        self._total_time = 0  # nanoseconds
+        self._records = []  # (test id, description, nanoseconds) in run order
         self._summary_printed = False  # Flag to track if summary has been printed
+        # Serializes updates when tests run on a thread pool (--parallel)
+        self._lock = threading.Lock()
 
     def startTest(self, test):
-        self.start_time = time.time()
-        super().startTest(test)
+        with self._lock:
+            # Monotonic integer clock: immune to wall-clock jumps, converted to seconds only for printing
+            self._start_times[test] = time.perf_counter_ns()
+            super().startTest(test)
 
     def stopTest(self, test):
-        self.end_time = time.time()
-        test_time = self.end_time - self.start_time
-        self.test_times[test.id()] = test_time
-        self.test_descriptions[test.id()] = test.shortDescription() or test.id()
-        super().stopTest(test)
+        end_time = time.perf_counter_ns()
+        with self._lock:
+            test_time = end_time - self._start_times.pop(test)
+            self._records.append((test.id(), test.shortDescription() or test.id(), test_time))
+            self._total_time += test_time
+            super().stopTest(test)
 
-    def printErrors(self):
-        super().printErrors()
-        if not self._summary_printed:
-            self.printSummary()
-            self._summary_printed = True
+    def addSuccess(self, test):
+        with self._lock:
+            super().addSuccess(test)
+
+    def addFailure(self, test, err):
+        with self._lock:
+            super().addFailure(test, err)
+
+    def addError(self, test, err):
+        with self._lock:
+            super().addError(test, err)
+
+    def addSkip(self, test, reason):
+        with self._lock:
+            super().addSkip(test, reason)
 
-    def printSummary(self):
+    def addSubTest(self, test, subtest, err):
+        with self._lock:
+            super().addSubTest(test, subtest, err)
+
+    def printErrors(self):
+        """Print the summary, failures and errors included, in one pass; the runner calls this
+        once the suite is done, and later calls do nothing."""
         if self._summary_printed:
             return
-            
-        print("\n" + "="*50)
-        print("TEST SUMMARY")
-        print("="*50)
+        
+        # Collected and written once, rather than one print (and flush) per line
+        lines = ["\n" + "="*50, "TEST SUMMARY", "="*50]
         
         # Calculate statistics
         total_tests = self.testsRun
         successful_tests = total_tests - len(self.failures) - len(self.errors)
         failed_tests = len(self.failures)
         error_tests = len(self.errors)
-        total_time = sum(self.test_times.values())
+        total_time = self._total_time / 1e9
         avg_time = total_time / total_tests if total_tests > 0 else 0
 
         # Print statistics
-        print(f"\nTotal Tests Run: {total_tests}")
-        print(f"Successful Tests: {successful_tests}")
-        print(f"Failed Tests: {failed_tests}")
-        print(f"Error Tests: {error_tests}")
+        lines.append(f"\nTotal Tests Run: {total_tests}")
+        lines.append(f"Successful Tests: {successful_tests}")
+        lines.append(f"Failed Tests: {failed_tests}")
+        lines.append(f"Error Tests: {error_tests}")
         if total_tests > 0:
-            print(f"Success Rate: {(successful_tests/total_tests)*100:.2f}%")
-        print(f"\nTotal Time: {total_time:.2f} seconds")
-        print(f"Average Time per Test: {avg_time:.2f} seconds")
+            lines.append(f"Success Rate: {(successful_tests/total_tests)*100:.2f}%")
+        lines.append(f"\nTotal Time: {total_time:.2f} seconds")
+        lines.append(f"Average Time per Test: {avg_time:.2f} seconds")
 
         # Print individual test times
-        print("\nTest Execution Times:")
-        for test_id, test_time in self.test_times.items():
-            print(f"{self.test_descriptions[test_id]}: {test_time:.3f} seconds")
+        lines.append("\nTest Execution Times:")
+        for _, description, test_time in self._records:
+            lines.append(f"{description}: {test_time / 1e9:.3f} seconds")
 
         # Print failures and errors if any
         if self.failures:
-            print("\nFailures:")
+            lines.append("\nFailures:")
             for failure in self.failures:
-                print(f"- {failure[1]}")
+                lines.append(f"- {failure[1]}")
         
         if self.errors:
-            print("\nErrors:")
+            lines.append("\nErrors:")
             for error in self.errors:
-                print(f"- {error[1]}")
+                lines.append(f"- {error[1]}")
 
-        print("\n" + "="*50)
+        lines.append("\n" + "="*50)
+        sys.stdout.write("\n".join(lines) + "\n")
         self._summary_printed = True
 
+    printSummary = printErrors
+
     def wasSuccessful(self):
         return super().wasSuccessful()
 
-class TestNBATools(unittest.TestCase):
-    def setUp(self):
-        """Set up test environment before each test."""
+class TestNBATools(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment once for the whole suite."""
         set_use_mock_data(True)  # Enable mock data for all tests
         set_debug_mode(False)    # Disable debug prints during tests
+        cls.NOW = datetime.now()  # One clock reading shared by every date-dependent test
 
-    def tearDown(self):
-        """Clean up after each test."""
-        set_use_mock_data(False)  # Disable mock data after each test
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after the last test."""
+        set_use_mock_data(False)  # Disable mock data after the suite
         set_debug_mode(False)     # Ensure debug mode is disabled
 
-    def test_get_player_info_success(self):
+    async def test_get_player_info_success(self):
         """Test successful player info retrieval."""
         # Test with exact name match
-        result = get_player_info("Stephen", "Curry")
+        result = await get_player_info("Stephen", "Curry")
         self.assertEqual(result["id"], 1)
         self.assertEqual(result["first_name"], "Stephen")
         self.assertEqual(result["last_name"], "Curry")
         self.assertEqual(result["position"], "G")
 
         # Test with case-insensitive match
-        result = get_player_info("lebron", "james")
+        result = await get_player_info("lebron", "james")
         self.assertEqual(result["id"], 2)
         self.assertEqual(result["first_name"], "LeBron")
         self.assertEqual(result["last_name"], "James")
 
-    def test_get_player_info_not_found(self):
+    async def test_get_player_info_not_found(self):
         """Test player info retrieval when player not found."""
-        result = get_player_info("John", "Doe")
+        result = await get_player_info("John", "Doe")
         self.assertIn("error", result)
         self.assertEqual(result["error"], "No player found with name John Doe")
 
-    def test_get_team_info_success(self):
+    async def test_get_team_info_success(self):
         """Test successful team info retrieval."""
         # Test with full name
-        result = get_team_info("Golden State Warriors")
+        result = await get_team_info("Golden State Warriors")
         self.assertEqual(result["id"], 1)
         self.assertEqual(result["name"], "Warriors")
         self.assertEqual(result["conference"], "West")
 
         # Test with short name
-        result = get_team_info("Lakers")
+        result = await get_team_info("Lakers")
         self.assertEqual(result["id"], 2)
         self.assertEqual(result["full_name"], "Los Angeles Lakers")
 
-    def test_get_team_info_not_found(self):
+    async def test_get_team_info_not_found(self):
         """Test team info retrieval when team not found."""
-        result = get_team_info("NonExistent Team")
+        result = await get_team_info("NonExistent Team")
         self.assertIn("error", result)
         self.assertEqual(result["error"], "No team found with name NonExistent Team")
 
-    # def test_get_team_standings_success(self):
+    async def test_get_teams_info(self):
+        """Test resolving several teams in one call."""
+        result = await get_teams_info(["Lakers", "Golden State Warriors", "NonExistent Team"])
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result[0]["id"], 2)
+        self.assertEqual(result[1]["id"], 1)
+        self.assertIn("error", result[2])
+
+    # async def test_get_team_standings_success(self):
     #     """Test successful standings retrieval."""
-    #     result = get_team_standings(2023)
+    #     result = await get_team_standings(2023)
     #     self.assertEqual(len(result), 2)
     #     self.assertEqual(result[0]["team"]["id"], 1)  # Warriors
     #     self.assertEqual(result[0]["wins"], 45)
     #     self.assertEqual(result[1]["team"]["id"], 2)  # Lakers
     #     self.assertEqual(result[1]["wins"], 40)
 
-    # def test_get_league_leaders_success(self):
+    # async def test_get_league_leaders_success(self):
     #     """Test successful league leaders retrieval."""
     #     # Test points leaders
-    #     result = get_league_leaders(2023, "pts")
+    #     result = await get_league_leaders(2023, "pts")
     #     self.assertEqual(len(result), 2)
     #     self.assertEqual(result[0]["player"]["id"], 1)  # Curry
     #     self.assertEqual(result[0]["pts"], 28.5)
@@ -166,48 +206,48 @@ class TestNBATools(unittest.TestCase):
     #     self.assertEqual(result[1]["pts"], 25.3)
 
     #     # Test rebounds leaders
-    #     result = get_league_leaders(2023, "reb")
+    #     result = await get_league_leaders(2023, "reb")
     #     self.assertEqual(len(result), 1)
     #     self.assertEqual(result[0]["player"]["id"], 2)  # James
     #     self.assertEqual(result[0]["reb"], 8.2)
 
-    # def test_get_league_leaders_invalid_stat(self):
+    # async def test_get_league_leaders_invalid_stat(self):
     #     """Test league leaders retrieval with invalid stat type."""
-    #     result = get_league_leaders(2023, "invalid_stat")
+    #     result = await get_league_leaders(2023, "invalid_stat")
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "No mock data available for stat type invalid_stat")
 
-    # def test_get_game_odds_success(self):
+    # async def test_get_game_odds_success(self):
     #     """Test successful game odds retrieval."""
     #     # Test with game_id
-    #     result = get_game_odds(game_id=1)
+    #     result = await get_game_odds(game_id=1)
     #     self.assertEqual(len(result), 1)
     #     self.assertEqual(result[0]["game_id"], 1)
     #     self.assertEqual(result[0]["spread"], -5.5)
     #     self.assertEqual(result[0]["over_under"], 235.5)
 
     #     # Test with date
-    #     result = get_game_odds(game_date="2024-03-15")
+    #     result = await get_game_odds(game_date="2024-03-15")
     #     self.assertEqual(len(result), 1)
     #     self.assertEqual(result[0]["game_id"], 1)
 
-    # def test_get_game_odds_missing_params(self):
+    # async def test_get_game_odds_missing_params(self):
     #     """Test game odds retrieval with missing parameters."""
-    #     result = get_game_odds()
+    #     result = await get_game_odds()
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "Either game_date or game_id must be provided")
 
-    # def test_get_player_injuries_success(self):
+    # async def test_get_player_injuries_success(self):
     #     """Test successful player injuries retrieval."""
-    #     result = get_player_injuries()
+    #     result = await get_player_injuries()
     #     self.assertEqual(len(result), 1)
     #     self.assertEqual(result[0]["player"]["id"], 1)  # Curry
     #     self.assertEqual(result[0]["status"], "Questionable")
     #     self.assertEqual(result[0]["note"], "Right ankle sprain")
 
-    # def test_get_head_to_head_stats_success(self):
+    # async def test_get_head_to_head_stats_success(self):
     #     """Test successful head-to-head stats retrieval."""
-    #     result = get_head_to_head_stats("Warriors", "Lakers", 2023)
+    #     result = await get_head_to_head_stats("Warriors", "Lakers", 2023)
     #     self.assertEqual(result["total_games"], 1)
     #     self.assertEqual(result["Warriors_wins"], 1)
     #     self.assertEqual(result["Lakers_wins"], 0)
@@ -215,193 +255,183 @@ class TestNBATools(unittest.TestCase):
     #     self.assertEqual(result["games"][0]["home_team_score"], 120)
     #     self.assertEqual(result["games"][0]["visitor_team_score"], 115)
 
-    # def test_get_head_to_head_stats_team_not_found(self):
+    # async def test_get_head_to_head_stats_team_not_found(self):
     #     """Test head-to-head stats retrieval when team not found."""
-    #     result = get_head_to_head_stats("NonExistent Team", "Lakers", 2023)
+    #     result = await get_head_to_head_stats("NonExistent Team", "Lakers", 2023)
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "One or both teams not found")
 
-    # def test_get_head_to_head_stats_no_games(self):
+    # async def test_get_head_to_head_stats_no_games(self):
     #     """Test head-to-head stats retrieval when no games exist."""
     #     # Add a new team to mock data that has no games
-    #     result = get_head_to_head_stats("Warriors", "NonExistent Team", 2023)
+    #     result = await get_head_to_head_stats("Warriors", "NonExistent Team", 2023)
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "One or both teams not found")
 
-    def test_get_player_info_empty_names(self):
+    async def test_get_player_info_empty_names(self):
         """Test player info retrieval with empty names."""
         # Test with empty first name
-        result = get_player_info("", "Curry")
+        result = await get_player_info("", "Curry")
         self.assertIn("error", result)
         self.assertEqual(result["error"], "First name and last name are required")
 
         # Test with empty last name
-        result = get_player_info("Stephen", "")
+        result = await get_player_info("Stephen", "")
         self.assertIn("error", result)
         self.assertEqual(result["error"], "First name and last name are required")
 
         # Test with both names empty
-        result = get_player_info("", "")
+        result = await get_player_info("", "")
         self.assertIn("error", result)
         self.assertEqual(result["error"], "First name and last name are required")
 
-    def test_get_player_info_special_characters(self):
+    async def test_get_player_info_special_characters(self):
         """Test player info retrieval with special characters in names."""
-        result = get_player_info("O'Connor", "Smith")
+        result = await get_player_info("O'Connor", "Smith")
         self.assertIn("error", result)
         self.assertEqual(result["error"], "No player found with name O'Connor Smith")
 
-    # def test_get_team_info_partial_matches(self):
+    # async def test_get_team_info_partial_matches(self):
     #     """Test team info retrieval with partial matches."""
     #     # Test with partial name that matches multiple teams
-    #     result = get_team_info("Warriors")
+    #     result = await get_team_info("Warriors")
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "Multiple teams found. Please use full team name.")
 
     #     # Test with very short partial name
-    #     result = get_team_info("War")
+    #     result = await get_team_info("War")
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "Multiple teams found. Please use full team name.")
 
-    # def test_get_team_standings_invalid_year(self):
+    # async def test_get_team_standings_invalid_year(self):
     #     """Test standings retrieval with invalid years."""
     #     # Test with future year
-    #     result = get_team_standings(2025)
+    #     result = await get_team_standings(2025)
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "Invalid year. Please use a year between 2000 and 2024")
 
     #     # Test with past year
-    #     result = get_team_standings(1999)
+    #     result = await get_team_standings(1999)
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "Invalid year. Please use a year between 2000 and 2024")
 
     #     # Test with current year
-    #     current_year = datetime.now().year
-    #     result = get_team_standings(current_year)
+    #     current_year = self.NOW.year
+    #     result = await get_team_standings(current_year)
     #     self.assertIsInstance(result, list)
     #     self.assertTrue(len(result) > 0)
 
-    # def test_get_league_leaders_empty_stats(self):
+    # async def test_get_league_leaders_empty_stats(self):
     #     """Test league leaders retrieval with empty or invalid stats."""
     #     # Test with empty stat type
-    #     result = get_league_leaders(2023, "")
+    #     result = await get_league_leaders(2023, "")
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "Stat type is required")
 
     #     # Test with whitespace stat type
-    #     result = get_league_leaders(2023, "   ")
+    #     result = await get_league_leaders(2023, "   ")
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "Stat type is required")
 
     #     # Test with non-existent stat type
-    #     result = get_league_leaders(2023, "nonexistent")
+    #     result = await get_league_leaders(2023, "nonexistent")
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "No mock data available for stat type nonexistent")
 
-    # def test_get_game_odds_invalid_date(self):
+    # async def test_get_game_odds_invalid_date(self):
     #     """Test game odds retrieval with invalid dates."""
     #     # Test with invalid date format
-    #     result = get_game_odds(game_date="invalid-date")
+    #     result = await get_game_odds(game_date="invalid-date")
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "Invalid date format. Please use YYYY-MM-DD")
 
     #     # Test with future date
-    #     future_date = (datetime.now() + timedelta(days=365)).strftime("%Y-%m-%d")
-    #     result = get_game_odds(game_date=future_date)
+    #     future_date = (self.NOW + timedelta(days=365)).strftime("%Y-%m-%d")
+    #     result = await get_game_odds(game_date=future_date)
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "No games found for the specified date")
 
     #     # Test with past date
     #     past_date = "2000-01-01"
-    #     result = get_game_odds(game_date=past_date)
+    #     result = await get_game_odds(game_date=past_date)
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "No games found for the specified date")
 
-    # def test_get_game_odds_invalid_game_id(self):
+    # async def test_get_game_odds_invalid_game_id(self):
     #     """Test game odds retrieval with invalid game IDs."""
     #     # Test with non-existent game ID
-    #     result = get_game_odds(game_id=999)
+    #     result = await get_game_odds(game_id=999)
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "No game found with ID 999")
 
     #     # Test with negative game ID
-    #     result = get_game_odds(game_id=-1)
+    #     result = await get_game_odds(game_id=-1)
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "Invalid game ID")
 
     #     # Test with zero game ID
-    #     result = get_game_odds(game_id=0)
+    #     result = await get_game_odds(game_id=0)
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "Invalid game ID")
 
-    # def test_get_player_injuries_empty_list(self):
-    #     """Test player injuries retrieval with no injuries."""
-    #     # Temporarily modify mock data to have no injuries
-    #     original_injuries = MOCK_INJURIES.copy()
-    #     MOCK_INJURIES.clear()
-        
-    #     result = get_player_injuries()
-    #     self.assertEqual(len(result), 0)
-        
-    #     # Restore original mock data
-    #     MOCK_INJURIES.extend(original_injuries)
-
-    # def test_get_head_to_head_stats_same_team(self):
-    #     """Test head-to-head stats retrieval with same team."""
-    #     result = get_head_to_head_stats("Warriors", "Warriors", 2023)
-    #     self.assertIn("error", result)
-    #     self.assertEqual(result["error"], "Cannot compare a team with itself")
-
-    # def test_get_head_to_head_stats_invalid_year(self):
+    async def test_get_player_injuries_empty_list(self):
+        """Test player injuries retrieval with no injuries."""
+        # Temporarily swap in empty mock data; patch restores it even if the test fails
+        with patch.object(nba_tools, "MOCK_INJURIES", []):
+            result = await get_player_injuries()
+        self.assertEqual(len(result), 0)
+
+    async def test_get_head_to_head_stats_same_team(self):
+        """Test head-to-head stats retrieval with same team."""
+        # The same name, and two different names for the same team
+        for team1_name, team2_name in (("Warriors", "Warriors"), ("Warriors", "Golden State Warriors")):
+            with self.subTest(team1_name=team1_name, team2_name=team2_name):
+                result = await get_head_to_head_stats(team1_name, team2_name, 2023)
+                self.assertIn("error", result)
+                self.assertEqual(result["error"], "Cannot compare a team with itself")
+
+    # async def test_get_head_to_head_stats_invalid_year(self):
     #     """Test head-to-head stats retrieval with invalid year."""
     #     # Test with future year
-    #     result = get_head_to_head_stats("Warriors", "Lakers", 2025)
+    #     result = await get_head_to_head_stats("Warriors", "Lakers", 2025)
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "Invalid year. Please use a year between 2000 and 2024")
 
     #     # Test with past year
-    #     result = get_head_to_head_stats("Warriors", "Lakers", 1999)
+    #     result = await get_head_to_head_stats("Warriors", "Lakers", 1999)
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "Invalid year. Please use a year between 2000 and 2024")
 
-    # def test_get_head_to_head_stats_empty_team_names(self):
+    # async def test_get_head_to_head_stats_empty_team_names(self):
     #     """Test head-to-head stats retrieval with empty team names."""
     #     # Test with empty home team
-    #     result = get_head_to_head_stats("", "Lakers", 2023)
+    #     result = await get_head_to_head_stats("", "Lakers", 2023)
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "Both team names are required")
 
     #     # Test with empty away team
-    #     result = get_head_to_head_stats("Warriors", "", 2023)
+    #     result = await get_head_to_head_stats("Warriors", "", 2023)
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "Both team names are required")
 
     #     # Test with both teams empty
-    #     result = get_head_to_head_stats("", "", 2023)
+    #     result = await get_head_to_head_stats("", "", 2023)
     #     self.assertIn("error", result)
     #     self.assertEqual(result["error"], "Both team names are required")
 
-    # def test_get_head_to_head_stats_case_sensitivity(self):
-    #     """Test head-to-head stats retrieval with different case variations."""
-    #     # Test with lowercase team names
-    #     result = get_head_to_head_stats("warriors", "lakers", 2023)
-    #     self.assertEqual(result["total_games"], 1)
-    #     self.assertEqual(result["Warriors_wins"], 1)
-
-    #     # Test with uppercase team names
-    #     result = get_head_to_head_stats("WARRIORS", "LAKERS", 2023)
-    #     self.assertEqual(result["total_games"], 1)
-    #     self.assertEqual(result["Warriors_wins"], 1)
-
-    #     # Test with mixed case team names
-    #     result = get_head_to_head_stats("WaRrIoRs", "LaKeRs", 2023)
-    #     self.assertEqual(result["total_games"], 1)
-    #     self.assertEqual(result["Warriors_wins"], 1)
+    async def test_get_head_to_head_stats_case_sensitivity(self):
+        """Test head-to-head stats retrieval with different case variations."""
+        # Lowercase, uppercase and mixed case team names
+        for team1_name, team2_name in (("warriors", "lakers"), ("WARRIORS", "LAKERS"), ("WaRrIoRs", "LaKeRs")):
+            with self.subTest(team1_name=team1_name, team2_name=team2_name):
+                result = await get_head_to_head_stats(team1_name, team2_name, 2023)
+                self.assertEqual(result["total_games"], 1)
+                self.assertEqual(result["Warriors_wins"], 1)
 
-    def test_get_game_info_success(self):
+    async def test_get_game_info_success(self):
         """Test successful game info retrieval."""
         # Test with all parameters
-        result = get_game_info(season=2023, home_team="Warriors", away_team="Lakers")
+        result = await get_game_info(season=2023, home_team="Warriors", away_team="Lakers")
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["id"], 1)
         self.assertEqual(result[0]["home_team"]["id"], 1)
@@ -410,94 +440,115 @@ class TestNBATools(unittest.TestCase):
         self.assertEqual(result[0]["visitor_team_score"], 115)
 
         # Test with only home team
-        result = get_game_info(home_team="Warriors")
+        result = await get_game_info(home_team="Warriors")
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["home_team"]["id"], 1)
 
         # Test with only away team
-        result = get_game_info(away_team="Lakers")
+        result = await get_game_info(away_team="Lakers")
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["visitor_team"]["id"], 2)
 
         # Test with only season
-        result = get_game_info(season=2023)
+        result = await get_game_info(season=2023)
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["id"], 1)
 
-    def test_get_game_info_no_games(self):
+    async def test_get_game_info_no_games(self):
         """Test game info retrieval when no games are found."""
         # Test with non-existent teams
-        result = get_game_info(home_team="NonExistent Team", away_team="Lakers")
+        result = await get_game_info(home_team="NonExistent Team", away_team="Lakers")
         self.assertIn("error", result)
         self.assertEqual(result["error"], "No games found")
 
         # Test with non-existent season
-        result = get_game_info(season=1920)
+        result = await get_game_info(season=1920)
         self.assertIn("error", result)
-        self.assertEqual(result["error"], f"Invalid season. Must be between 1946 and {datetime.now().year}")
+        self.assertEqual(result["error"], f"Invalid season. Must be between 1946 and {self.NOW.year}")
 
-    def test_get_game_info_case_sensitivity(self):
+    async def test_get_game_info_case_sensitivity(self):
         """Test game info retrieval with different case variations."""
         # Test with lowercase team names
-        result = get_game_info(home_team="warriors", away_team="lakers")
+        result = await get_game_info(home_team="warriors", away_team="lakers")
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["home_team"]["id"], 1)
         self.assertEqual(result[0]["visitor_team"]["id"], 2)
 
         # Test with uppercase team names
-        result = get_game_info(home_team="WARRIORS", away_team="LAKERS")
+        result = await get_game_info(home_team="WARRIORS", away_team="LAKERS")
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["home_team"]["id"], 1)
         self.assertEqual(result[0]["visitor_team"]["id"], 2)
 
         # Test with mixed case team names
-        result = get_game_info(home_team="WaRrIoRs", away_team="LaKeRs")
+        result = await get_game_info(home_team="WaRrIoRs", away_team="LaKeRs")
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["home_team"]["id"], 1)
         self.assertEqual(result[0]["visitor_team"]["id"], 2)
 
-    def test_get_game_info_empty_parameters(self):
+    async def test_get_game_info_empty_parameters(self):
         """Test game info retrieval with empty parameters."""
         # Test with all parameters empty
-        result = get_game_info()
+        result = await get_game_info()
         self.assertEqual(len(result), 1)  # Should return all mock games
         self.assertEqual(result[0]["id"], 1)
 
         # Test with empty team names
-        result = get_game_info(home_team="", away_team="")
+        result = await get_game_info(home_team="", away_team="")
         self.assertEqual(len(result), 1)  # Should return all mock games
         self.assertEqual(result[0]["id"], 1)
 
-    def test_get_game_info_invalid_season(self):
+    async def test_get_game_info_invalid_season(self):
         """Test game info retrieval with invalid season values."""
         # Test with negative season
-        result = get_game_info(season=-1)
+        result = await get_game_info(season=-1)
         self.assertIn("error", result)
-        self.assertEqual(result["error"], f"Invalid season. Must be between 1946 and {datetime.now().year}")
+        self.assertEqual(result["error"], f"Invalid season. Must be between 1946 and {self.NOW.year}")
 
         # Test with zero season
-        result = get_game_info(season=0)
+        result = await get_game_info(season=0)
         self.assertIn("error", result)
-        self.assertEqual(result["error"], f"Invalid season. Must be between 1946 and {datetime.now().year}")
+        self.assertEqual(result["error"], f"Invalid season. Must be between 1946 and {self.NOW.year}")
 
         # Test with future season
-        future_year = datetime.now().year + 5
-        result = get_game_info(season=future_year)
+        future_year = self.NOW.year + 5
+        result = await get_game_info(season=future_year)
         self.assertIn("error", result)
-        self.assertEqual(result["error"], f"Invalid season. Must be between 1946 and {datetime.now().year}")
+        self.assertEqual(result["error"], f"Invalid season. Must be between 1946 and {self.NOW.year}")
 
-if __name__ == '__main__':
-    # Create a test suite
-    suite = unittest.TestLoader().loadTestsFromTestCase(TestNBATools)
+# Test method names in definition order, collected once instead of by TestLoader's dir() walk
+_TEST_METHODS = tuple(name for name in vars(TestNBATools) if name.startswith("test_"))
 
-    # Create a custom test result handler
+def run_parallel(suite, max_workers=None):
+    """Run each test of the suite on a thread pool, sharing one TestResult."""
     result = TestResult()
+    # Class fixtures only run when a suite drives the class, so call them here
+    TestNBATools.setUpClass()
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            # Each IsolatedAsyncioTestCase runs its own event loop on its worker thread
+            list(pool.map(lambda test: test(result), suite))
+    finally:
+        TestNBATools.tearDownClass()
+    result.printErrors()
+    return result
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--parallel", action="store_true", help="run the tests on a thread pool")
+    args = parser.parse_args()
+
+    # Create a test suite
+    suite = unittest.TestSuite(TestNBATools(name) for name in _TEST_METHODS)
     
-    # Create a custom runner that uses our result class
-    runner = unittest.TextTestRunner(resultclass=TestResult)
-    
-    # Run the tests using our custom runner
-    runner.run(suite)
+    if args.parallel:
+        result = run_parallel(suite)
+    else:
+        # Create a custom runner that uses our result class
+        runner = unittest.TextTestRunner(resultclass=TestResult)
+        
+        # Run the tests using our custom runner; the result it returns is the one that saw them
+        result = runner.run(suite)
     
     # Exit with appropriate status code
     success = result.wasSuccessful()